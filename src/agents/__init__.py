@@ -1,19 +1,27 @@
+import importlib
 from agents.base_agent import BaseDebateAgent
-from agents.llm_agent import LLMAgent
-from agents.scientist import ScientistAgent
-from agents.philosopher import PhilosopherAgent
 from agents.agent_registry import AgentRegistry, agent_registry
 
-# Register concrete agent implementations
-agent_registry.register_agent('scientist', ScientistAgent)
-agent_registry.register_agent('philosopher', PhilosopherAgent) 
-agent_registry.register_agent('llm', LLMAgent)  # Generic LLM agent
+# Concrete agents pull in langchain_openai, so they are imported on first
+# attribute access (PEP 562) and registered by AgentRegistry._lazy_init
+_LAZY_AGENTS = {
+    'LLMAgent': 'agents.llm_agent',
+}
 
 __all__ = [
     'BaseDebateAgent',
-    'LLMAgent', 
-    'ScientistAgent',
-    'PhilosopherAgent',
+    'LLMAgent',
     'AgentRegistry',
     'agent_registry'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Import concrete agent classes on demand"""
+    if name in _LAZY_AGENTS:
+        value = getattr(importlib.import_module(_LAZY_AGENTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return __all__
@@ -1,6 +1,5 @@
 from typing import Dict, Type, Any, List
 from agents.base_agent import BaseDebateAgent
-from agents.llm_agent import LLMAgent
 
 class AgentRegistry:
     """Registry for managing and creating debate agents"""
@@ -8,6 +7,7 @@ class AgentRegistry:
     def __init__(self):
         self._agent_classes: Dict[str, Type[BaseDebateAgent]] = {}
         self._default_configs = {}
+        self._default_config_dicts: Dict[str, Dict[str, Any]] = {}
         self._initialized = False
     
     def _lazy_init(self):
@@ -18,6 +18,8 @@ class AgentRegistry:
         # Import default configs
         from config.settings import DEFAULT_AGENTS_CONFIG
         self._default_configs = DEFAULT_AGENTS_CONFIG
+        # Plain dict copies so create_agent never touches the dataclasses
+        self._default_config_dicts = {k: dict(vars(v)) for k, v in self._default_configs.items()}
         
         # Register default agents
         self.register_default_agents()
@@ -29,13 +31,18 @@ class AgentRegistry:
     
     def register_default_agents(self):
         """Register default agent types"""
-        # Import agent classes here to avoid circular imports
-        from agents.scientist import ScientistAgent
-        from agents.philosopher import PhilosopherAgent
+        # Import agent classes here to avoid circular imports and to keep
+        # langchain_openai out of `import agents`
+        from agents.llm_agent import LLMAgent
         
-        self.register_agent('scientist', ScientistAgent)
-        self.register_agent('philosopher', PhilosopherAgent)
-        self.register_agent('llm', LLMAgent)
+        from config.settings import DEFAULT_AGENTS_CONFIG
+        
+        # Personas are pure data: LLMAgent picks up name, persona and
+        # system_prompt from DEFAULT_AGENTS_CONFIG in create_agent.
+        # Classes registered explicitly beforehand are kept.
+        for agent_id in DEFAULT_AGENTS_CONFIG:
+            self._agent_classes.setdefault(agent_id, LLMAgent)
+        self._agent_classes.setdefault('llm', LLMAgent)
     
     def create_agent(self, agent_id: str, agent_type: str = None, **config) -> BaseDebateAgent:
         """Create a new agent instance
@@ -51,15 +58,15 @@ class AgentRegistry:
         if agent_type is None:
             agent_type = agent_id
         
-        if agent_type not in self._agent_classes:
+        agent_class = self._agent_classes.get(agent_type)
+        if agent_class is None:
             raise ValueError(f"Unknown agent type: {agent_type}. Available: {list(self._agent_classes.keys())}")
         
         # Merge with default config if available
-        if agent_id in self._default_configs:
-            default_config = vars(self._default_configs[agent_id])
-            config = {**default_config, **config}
+        default_config = self._default_config_dicts.get(agent_id)
+        if default_config:
+            config = dict(default_config, **config)
         
-        agent_class = self._agent_classes[agent_type]
         return agent_class(agent_id, config)
     
     def get_available_agents(self) -> List[str]:
@@ -1,37 +1,89 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from langchain_core.messages import HumanMessage, SystemMessage
-import re
-from utils.validators import ArgumentValidator
+from itertools import islice
+from typing import List, Dict, Any, Optional, Sequence, AbstractSet
 from config.settings import VALIDATION_CONFIG
 
+# Static part of the refinement prompt, shared by every refinement request
+_REFINEMENT_INSTRUCTIONS = """
+        
+        Please provide a DIFFERENT, more substantial argument that:
+        1. Is at least 10 words and substantive
+        2. Offers a genuinely novel perspective or point
+        3. Is well-reasoned and stays in character
+        4. Does not repeat or closely mirror previous arguments
+        5. Uses logical connectors (because, therefore, however)
+        """
+
+def preview_argument(argument: str, n: int = 100) -> str:
+    """Truncated preview of an argument, stored once when it is used"""
+    return f"{argument[:n]}..."
+
+def _bullet_trunc(text: str, n: int = 100) -> str:
+    """Format an argument as a truncated bullet for prompt context"""
+    return f"- {text[:n]}..."
+
+def _bullet_previews(previews: List[str]) -> str:
+    """Format pre-truncated previews as bullets"""
+    return "- " + "\n- ".join(previews)
+
+def _tail(items: Sequence[str], n: int) -> List[str]:
+    """Last n items of a list or deque (deques do not support slicing)"""
+    return list(islice(items, max(0, len(items) - n), None))
+
+def _recent_previews(used_arguments: List[str], used_previews: Optional[Sequence[str]], n: int) -> List[str]:
+    """Previews of the last n used arguments, computed only if not stored"""
+    if used_previews is not None:
+        return _tail(used_previews, n)
+    return [preview_argument(arg) for arg in _tail(used_arguments, n)]
+
 class BaseDebateAgent(ABC):
     """Abstract base class for all debate agents"""
     
+    llm = None  # To be provided by subclasses if needed
+    _validator = None  # Shared ArgumentValidator, see _get_validator
+    
     def __init__(self, agent_id: str, config: Dict[str, Any]):
         self.agent_id = agent_id
         self.config = config
-        # Match the parameter names from your validators.py
-        self.validator = ArgumentValidator(
-            min_length=VALIDATION_CONFIG.get('min_argument_length', 10),
-            max_similarity=VALIDATION_CONFIG.get('similarity_threshold', 0.7)  
-        )
-        self.llm = None  # To be initialized by subclasses if needed
+    
+    @classmethod
+    def _get_validator(cls):
+        """Argument validator, built on first validation and shared by the class
+        
+        Its settings come from the global VALIDATION_CONFIG, so every agent
+        of a class can use the same instance.
+        """
+        if cls._validator is None:
+            from utils.validators import ArgumentValidator
+            # Match the parameter names from your validators.py
+            cls._validator = ArgumentValidator(
+                min_length=VALIDATION_CONFIG.get('min_argument_length', 10),
+                max_similarity=VALIDATION_CONFIG.get('similarity_threshold', 0.7)
+            )
+        return cls._validator
     
     @abstractmethod
-    def generate_argument(self, topic: str, memory: List[str], used_arguments: List[str]) -> str:
+    def generate_argument(self, topic: str, memory: List[str], used_arguments: List[str],
+                          used_previews: Optional[List[str]] = None,
+                          used_hashes: Optional[AbstractSet[int]] = None) -> str:
         """Generate a debate argument based on topic and context
         
         Args:
             topic: The debate topic
             memory: This agent's conversation memory
             used_arguments: All arguments used so far in the debate
+            used_previews: Truncated previews of used_arguments, if tracked
+            used_hashes: Fingerprints of used_arguments, if tracked
             
         Returns:
             Generated argument string
         """
         pass
     
+    def record_argument(self, argument: str):
+        """Tell the validator an argument was added to the debate's used_arguments"""
+        self._get_validator().record_accepted(argument)
+    
     def get_name(self) -> str:
         """Get the display name of the agent"""
         return self.config.get('name', self.agent_id.title())
@@ -40,13 +92,17 @@ class BaseDebateAgent(ABC):
         """Get the persona description"""
         return self.config.get('persona', 'Debater')
     
-    def validate_and_refine_argument(self, argument: str, used_arguments: List[str], max_attempts: int = None) -> str:
+    def validate_and_refine_argument(self, argument: str, used_arguments: List[str], max_attempts: int = None,
+                                     used_previews: Optional[List[str]] = None,
+                                     used_hashes: Optional[AbstractSet[int]] = None) -> str:
         """Validate argument and refine if necessary
         
         Args:
             argument: The argument to validate
             used_arguments: Previously used arguments
             max_attempts: Maximum refinement attempts (from config if not provided)
+            used_previews: Truncated previews of used_arguments, if tracked
+            used_hashes: Fingerprints of used_arguments, if tracked
             
         Returns:
             Valid argument (either original or refined)
@@ -54,13 +110,15 @@ class BaseDebateAgent(ABC):
         if max_attempts is None:
             max_attempts = VALIDATION_CONFIG.get('max_refinement_attempts', 3)
         
+        validator = self._get_validator()
+        
         for attempt in range(max_attempts):
             # Check if argument is valid
-            if self.validator.is_valid_argument(argument, used_arguments):
+            if validator.is_valid_argument(argument, used_arguments, used_hashes=used_hashes):
                 return argument
             
             # Get specific validation errors using your validator's method
-            feedback = self.validator.get_validation_feedback(argument, used_arguments)
+            feedback = validator.get_validation_feedback(argument, used_arguments, used_hashes=used_hashes)
             
             # If this is the last attempt, return what we have
             if attempt == max_attempts - 1:
@@ -68,7 +126,7 @@ class BaseDebateAgent(ABC):
             
             # Try to refine the argument
             if hasattr(self, 'refine_argument'):
-                refinement_prompt = self._build_refinement_prompt(argument, used_arguments, feedback)
+                refinement_prompt = self._build_refinement_prompt(argument, used_arguments, feedback, used_previews)
                 try:
                     argument = self.refine_argument(refinement_prompt)
                 except Exception as e:
@@ -80,24 +138,47 @@ class BaseDebateAgent(ABC):
         
         return argument
     
-    def _build_refinement_prompt(self, argument: str, used_arguments: List[str], feedback: str) -> str:
+    async def avalidate_and_refine_argument(self, argument: str, used_arguments: List[str], max_attempts: int = None,
+                                            used_previews: Optional[List[str]] = None,
+                                            used_hashes: Optional[AbstractSet[int]] = None) -> str:
+        """Async variant of validate_and_refine_argument that awaits refinement"""
+        if max_attempts is None:
+            max_attempts = VALIDATION_CONFIG.get('max_refinement_attempts', 3)
+        
+        validator = self._get_validator()
+        
+        for attempt in range(max_attempts):
+            if validator.is_valid_argument(argument, used_arguments, used_hashes=used_hashes):
+                return argument
+            
+            feedback = validator.get_validation_feedback(argument, used_arguments, used_hashes=used_hashes)
+            
+            if attempt == max_attempts - 1:
+                return argument
+            
+            if hasattr(self, 'arefine_argument'):
+                refinement_prompt = self._build_refinement_prompt(argument, used_arguments, feedback, used_previews)
+                try:
+                    argument = await self.arefine_argument(refinement_prompt)
+                except Exception as e:
+                    return argument
+            else:
+                return argument
+        
+        return argument
+    
+    def _build_refinement_prompt(self, argument: str, used_arguments: List[str], feedback: str,
+                                 used_previews: Optional[List[str]] = None) -> str:
         """Build a prompt for refining an invalid argument"""
-        recent_args = used_arguments[-5:] if used_arguments else []
+        recent_args = _recent_previews(used_arguments, used_previews, 5) if used_arguments else []
+        recent_section = _bullet_previews(recent_args) if recent_args else 'None'
         
         return f"""
         Your previous argument was rejected for the following reason:
         {feedback}
         
         Recent arguments to avoid repeating:
-        {chr(10).join(f'- {arg[:100]}...' for arg in recent_args) if recent_args else 'None'}
-        
-        Please provide a DIFFERENT, more substantial argument that:
-        1. Is at least 10 words and substantive
-        2. Offers a genuinely novel perspective or point
-        3. Is well-reasoned and stays in character
-        4. Does not repeat or closely mirror previous arguments
-        5. Uses logical connectors (because, therefore, however)
-        
+        {recent_section}{_REFINEMENT_INSTRUCTIONS}
         Original argument: {argument}
         
         Provide ONLY your refined argument, with no meta-commentary.
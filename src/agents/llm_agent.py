@@ -1,43 +1,112 @@
-from agents.base_agent import BaseDebateAgent
-from langchain_openai import ChatOpenAI
+from agents.base_agent import BaseDebateAgent, _bullet_trunc, _bullet_previews, _recent_previews, _tail
+from core.llm_client import get_chat_model
 from langchain_core.messages import HumanMessage, SystemMessage
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, AbstractSet
+
+# Static instructions appended to every system prompt
+_INSTRUCTIONS_BLOCK = """
+
+Instructions:
+1. Provide a logical, well-reasoned argument from your professional perspective
+2. DO NOT repeat or closely mirror previous arguments - offer NEW insights
+3. Build upon or counter previous points when relevant
+4. Keep arguments concise but substantive (2-4 sentences, 30-100 words)
+5. Maintain professional tone and stay in character
+6. Be specific and avoid vague generalities
+
+Your response should be ONLY your argument, with no meta-commentary or explanations."""
+
+@lru_cache(maxsize=256)
+def _cached_completion(system_prompt: str, user_prompt: str, model: str, temperature: float) -> str:
+    """Run one chat completion, memoized on its full prompt and model settings
+    
+    Identical prompts skip the LLM round-trip entirely. Failed calls raise
+    and are therefore never cached.
+    """
+    messages = [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=user_prompt)
+    ]
+    return get_chat_model(model, temperature).invoke(messages).content.strip()
 
 class LLMAgent(BaseDebateAgent):
     """LLM-powered debate agent with persona-based argument generation"""
     
     def __init__(self, agent_id: str, config: Dict[str, Any]):
         super().__init__(agent_id, config)
-        self.llm = ChatOpenAI(
-            model=config.get('llm_model', 'gpt-3.5-turbo'),
-            temperature=config.get('temperature', 0.7)
-        )
+        self.llm_model = config.get('llm_model', 'gpt-3.5-turbo')
+        self.temperature = config.get('temperature', 0.7)
+        # The persona never changes during a debate, so build it once
+        self._persona_prefix = config.get('system_prompt', 'You are a participant in a formal debate.')
+        self._refine_system_prompt = f"{config.get('system_prompt', '')}\n\nYou need to refine your argument."
+        # Reusing generated arguments only makes sense for deterministic
+        # (temperature=0) runs, so it is opt-in
+        self.cache_responses = config.get('cache_responses', False)
     
-    def generate_argument(self, topic: str, memory: List[str], used_arguments: List[str]) -> str:
+    @property
+    def llm(self):
+        """Chat model client, created on first use and shared between agents
+        
+        Looked up on every access rather than stored on the agent, since
+        agent instances outlive configure_llm_client(), which replaces the
+        shared clients when the rate limits change.
+        """
+        return get_chat_model(self.llm_model, self.temperature)
+    
+    def generate_argument(self, topic: str, memory: List[str], used_arguments: List[str],
+                          used_previews: Optional[List[str]] = None,
+                          used_hashes: Optional[AbstractSet[int]] = None) -> str:
         """Generate argument using LLM with persona context
         
         Args:
             topic: The debate topic
             memory: This agent's previous arguments
             used_arguments: All arguments in the debate
+            used_previews: Truncated previews of used_arguments, if tracked
+            used_hashes: Fingerprints of used_arguments, if tracked
             
         Returns:
             Generated argument
         """
-        system_prompt = self._build_system_prompt(topic, used_arguments, memory)
+        system_prompt = self._build_system_prompt(topic, used_arguments, memory, used_previews)
+        user_prompt = f"Provide your argument about: {topic}"
+        
+        try:
+            if self.cache_responses:
+                argument = _cached_completion(system_prompt, user_prompt, self.llm_model, self.temperature)
+            else:
+                messages = [
+                    SystemMessage(content=system_prompt),
+                    HumanMessage(content=user_prompt)
+                ]
+                response = self.llm.invoke(messages)
+                argument = response.content.strip()
+            
+            # Validate and refine if necessary
+            return self.validate_and_refine_argument(argument, used_arguments, used_previews=used_previews,
+                                                     used_hashes=used_hashes)
+        except Exception as e:
+            # Fallback argument in case of API error
+            return f"[Error generating argument: {str(e)}]"
+    
+    async def agenerate_argument(self, topic: str, memory: List[str], used_arguments: List[str],
+                                 used_previews: Optional[List[str]] = None,
+                                 used_hashes: Optional[AbstractSet[int]] = None) -> str:
+        """Async variant of generate_argument, so several agents can be awaited together"""
+        system_prompt = self._build_system_prompt(topic, used_arguments, memory, used_previews)
         messages = [
             SystemMessage(content=system_prompt),
             HumanMessage(content=f"Provide your argument about: {topic}")
         ]
         
         try:
-            response = self.llm.invoke(messages)
+            response = await self.llm.ainvoke(messages)
             argument = response.content.strip()
             
-            # Validate and refine if necessary
-            return self.validate_and_refine_argument(argument, used_arguments)
+            return await self.avalidate_and_refine_argument(argument, used_arguments, used_previews=used_previews,
+                                                            used_hashes=used_hashes)
         except Exception as e:
-            # Fallback argument in case of API error
             return f"[Error generating argument: {str(e)}]"
     
     def refine_argument(self, refinement_prompt: str) -> str:
@@ -49,54 +118,54 @@ class LLMAgent(BaseDebateAgent):
         Returns:
             Refined argument
         """
-        persona = self.config.get('system_prompt', '')
-        
+        try:
+            if self.cache_responses:
+                return _cached_completion(self._refine_system_prompt, refinement_prompt,
+                                          self.llm_model, self.temperature)
+            messages = [
+                SystemMessage(content=self._refine_system_prompt),
+                HumanMessage(content=refinement_prompt)
+            ]
+            response = self.llm.invoke(messages)
+            return response.content.strip()
+        except Exception as e:
+            raise Exception(f"Failed to refine argument: {str(e)}")
+    
+    async def arefine_argument(self, refinement_prompt: str) -> str:
+        """Async variant of refine_argument"""
         messages = [
-            SystemMessage(content=f"{persona}\n\nYou need to refine your argument."),
+            SystemMessage(content=self._refine_system_prompt),
             HumanMessage(content=refinement_prompt)
         ]
         
         try:
-            response = self.llm.invoke(messages)
+            response = await self.llm.ainvoke(messages)
             return response.content.strip()
         except Exception as e:
             raise Exception(f"Failed to refine argument: {str(e)}")
     
-    def _build_system_prompt(self, topic: str, used_arguments: List[str], memory: List[str]) -> str:
+    def _build_system_prompt(self, topic: str, used_arguments: List[str], memory: List[str],
+                             used_previews: Optional[List[str]] = None) -> str:
         """Build system prompt with persona and context
         
         Args:
             topic: Debate topic
             used_arguments: All arguments used so far
             memory: This agent's memory
+            used_previews: Truncated previews of used_arguments, if tracked
             
         Returns:
             Complete system prompt
         """
-        persona = self.config.get('system_prompt', 'You are a participant in a formal debate.')
-        
         # Get recent context (last 3 used arguments, last 2 from memory)
-        recent_used = used_arguments[-3:] if used_arguments else []
-        recent_memory = memory[-2:] if memory else []
+        recent_used = _recent_previews(used_arguments, used_previews, 3) if used_arguments else []
+        recent_memory = _tail(memory, 2) if memory else []
         
         context_section = ""
         if recent_memory:
-            context_section += f"\n\nYour previous arguments:\n" + "\n".join(f"- {arg[:100]}..." for arg in recent_memory)
+            context_section += "\n\nYour previous arguments:\n" + "\n".join([_bullet_trunc(arg) for arg in recent_memory])
         
         if recent_used:
-            context_section += f"\n\nRecent arguments from all participants (DO NOT REPEAT):\n" + "\n".join(f"- {arg[:100]}..." for arg in recent_used)
+            context_section += "\n\nRecent arguments from all participants (DO NOT REPEAT):\n" + _bullet_previews(recent_used)
         
-        return f"""{persona}
-
-Debate Topic: {topic}
-{context_section}
-
-Instructions:
-1. Provide a logical, well-reasoned argument from your professional perspective
-2. DO NOT repeat or closely mirror previous arguments - offer NEW insights
-3. Build upon or counter previous points when relevant
-4. Keep arguments concise but substantive (2-4 sentences, 30-100 words)
-5. Maintain professional tone and stay in character
-6. Be specific and avoid vague generalities
-
-Your response should be ONLY your argument, with no meta-commentary or explanations."""
\ No newline at end of file
+        return f"{self._persona_prefix}\n\nDebate Topic: {topic}\n{context_section}{_INSTRUCTIONS_BLOCK}"
\ No newline at end of file
@@ -6,10 +6,18 @@ class DebateConfig:
     max_rounds: int = 8  # Changed to 8 as per task requirement
     default_agents: List[str] = None
     llm_model: str = "gpt-3.5-turbo"
-    judge_model: str = "gpt-4"
+    judge_model: str = "gpt-4o-mini"  # supports automatic prompt caching
     temperature: float = 0.7
     judge_temperature: float = 0.3
+    judge_max_tokens: int = 600  # Caps the judgment length
+    stream_judgment: bool = True  # Print the judgment as it is generated
     max_memory_size: int = 10  # For memory management
+    cache_responses: bool = False  # Reuse arguments for identical prompts (use with temperature=0)
+    parallel_rounds: bool = False  # All agents speak concurrently each round, without seeing that round's arguments
+    max_concurrent: int = 4  # Concurrent LLM requests per round when parallel_rounds is set
+    requests_per_minute: int = 0  # Client-side OpenAI RPM limit (0 disables)
+    tokens_per_minute: int = 0  # Client-side OpenAI TPM limit (0 disables)
+    max_retries: int = 5  # Retries with exponential backoff on 429/5xx responses
     
     def __post_init__(self):
         if self.default_agents is None:
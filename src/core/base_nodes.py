@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 from core.state import DebateState
+from core.llm_client import get_chat_model
+from agents.base_agent import preview_argument
+from utils.loggers import log_state_transition, log_argument, log_transcript_entry
+from utils.validators import argument_fingerprint
+from datetime import datetime
+from functools import cached_property
 import logging
 
 class BaseNode(ABC):
@@ -14,23 +18,101 @@ class BaseNode(ABC):
     
     @abstractmethod
     def execute(self, state: DebateState) -> DebateState:
-        """Execute node logic and return updated state"""
+        """Execute node logic and return the state keys it updates"""
         pass
     
     def __call__(self, state: DebateState) -> DebateState:
         """Make node callable by LangGraph"""
-        self.logger.info(f"Executing node: {self.name}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Executing node: {self.name}")
         
         # Log state transition
-        from utils.loggers import log_state_transition
         log_state_transition(self.name, state)
         
         result = self.execute(state)
         
         # Log after execution
-        self.logger.debug(f"Node {self.name} completed")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Node {self.name} completed")
         
         return result
+    
+    @staticmethod
+    def argument_cache_key(state: DebateState, agent_id: str) -> str:
+        """Response cache key for agent_id's next argument in this state"""
+        return f"{agent_id}|{state['topic']}|{state.get('last_argument', '')}"
+    
+    def record_arguments(self, state: DebateState, spoken: Iterable[Tuple[str, str]],
+                         agents: Mapping[str, Any]) -> Dict[str, Any]:
+        """Record arguments, in speaking order, and return the state keys they update
+        
+        spoken holds (agent_id, argument) pairs and agents maps each agent_id
+        to its agent. Agent nodes record one argument per step and the round
+        executor a whole round, through this one path: transcript entries,
+        memories, previews, running metrics and log files.
+        
+        Memories and previews are bounded deques appended in place and
+        returned as-is; full_transcript, used_arguments and
+        used_argument_hashes hold only the new values for their reducers.
+        """
+        names = state['agent_names']
+        memories = state['agent_memories']
+        previews = state['used_argument_previews']
+        seen_hashes = state.get('used_argument_hashes', ())
+        new_hashes = set()
+        unique_count = state.get('unique_arguments_count', 0)
+        contributions = dict(state.get('participant_contributions', {}))
+        # The transcript only ever grows, so each argument is rendered once
+        # instead of re-joining the whole history for the judge
+        transcript_lines = [state['transcript_cached_text']] if state.get('transcript_cached_text') else []
+        new_entries = []
+        new_arguments = []
+        round_number = state['current_round']
+        
+        for agent_id, argument in spoken:
+            round_number += 1
+            agent_name = names[agent_id]
+            entry = {
+                'round': round_number,
+                'speaker': agent_name,
+                'agent_id': agent_id,
+                'argument': argument,
+                'timestamp': str(datetime.now())
+            }
+            new_entries.append(entry)
+            new_arguments.append(argument)
+            agents[agent_id].record_argument(argument)
+            
+            fingerprint = argument_fingerprint(argument)
+            if fingerprint not in seen_hashes and fingerprint not in new_hashes:
+                unique_count += 1
+            new_hashes.add(fingerprint)
+            contributions[agent_name] = contributions.get(agent_name, 0) + 1
+            transcript_lines.append(f"Round {round_number} - {agent_name}: {argument}")
+            previews.append(preview_argument(argument))
+            
+            # Every agent receives the same entry
+            memory_entry = f"{agent_name}: {argument}"
+            for memory in memories.values():
+                assert getattr(memory, 'maxlen', None) is not None, "agent memories must be bounded deques"
+                memory.append(memory_entry)
+            
+            self.logger.info(f"[Round {round_number}] {agent_name}: {argument[:100]}...")
+            log_argument(round_number, agent_name, argument)
+            log_transcript_entry(entry)
+        
+        return {
+            'current_round': round_number,
+            'agent_memories': memories,
+            'full_transcript': new_entries,
+            'used_arguments': new_arguments,
+            'used_argument_hashes': new_hashes,
+            'used_argument_previews': previews,
+            'transcript_cached_text': "\n".join(transcript_lines),
+            'last_argument': new_arguments[-1] if new_arguments else state['last_argument'],
+            'unique_arguments_count': unique_count,
+            'participant_contributions': contributions
+        }
 
 class BaseAgentNode(BaseNode):
     """Base class for agent nodes with common functionality"""
@@ -39,13 +121,23 @@ class BaseAgentNode(BaseNode):
         super().__init__(f"agent_{agent_id}")
         self.agent_id = agent_id
         self.config = config
-        self.llm = ChatOpenAI(
-            model=config.get('llm_model', 'gpt-3.5-turbo'),
-            temperature=config.get('temperature', 0.7)
+    
+    @cached_property
+    def llm(self):
+        """Chat model client, created on first use and shared between nodes"""
+        return get_chat_model(
+            self.config.get('llm_model', 'gpt-3.5-turbo'),
+            self.config.get('temperature', 0.7)
         )
     
-    def get_agent_name(self) -> str:
-        """Get display name for the agent"""
+    def get_agent_name(self, state: Optional[DebateState] = None) -> str:
+        """Get display name for the agent
+        
+        The state's agent_names (built from the agents' configs at setup) is
+        authoritative, so transcripts use the names the judge expects.
+        """
+        if state is not None and self.agent_id in state.get('agent_names', {}):
+            return state['agent_names'][self.agent_id]
         return self.config.get('name', self.agent_id.title())
     
     def should_execute(self, state: DebateState) -> bool:
@@ -55,14 +147,3 @@ class BaseAgentNode(BaseNode):
         
         current_agent = state['agent_order'][state['current_agent_index']]
         return current_agent == self.agent_id
-    
-    def update_memories(self, state: DebateState, argument: str) -> Dict[str, List[str]]:
-        """Update memories for all agents"""
-        agent_name = self.get_agent_name()
-        new_memories = state['agent_memories'].copy()
-        
-        for agent_id in state['agent_memories']:
-            memory_entry = f"{agent_name}: {argument}"
-            new_memories[agent_id] = new_memories[agent_id] + [memory_entry]
-        
-        return new_memories
\ No newline at end of file
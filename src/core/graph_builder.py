@@ -5,14 +5,21 @@ from nodes.round_controller import RoundControllerNode
 from nodes.judge import JudgeNode
 from nodes.memory_manager import MemoryManagerNode
 from nodes.agent_factory import AgentNodeFactory
+from nodes.round_executor import RoundExecutorNode
 from typing import List, Dict, Any
 from config.settings import DebateConfig
+from core.llm_client import configure_llm_client
 
 class DebateGraphBuilder:
     """Builds and configures the debate graph dynamically using factory pattern"""
     
     def __init__(self, config: DebateConfig = None):
         self.config = config or DebateConfig()
+        configure_llm_client(
+            self.config.requests_per_minute,
+            self.config.tokens_per_minute,
+            self.config.max_retries
+        )
         self.graph = StateGraph(DebateState)
         self.nodes = {}
     
@@ -32,7 +39,8 @@ class DebateGraphBuilder:
             # Create agent configuration
             agent_config = {
                 'llm_model': self.config.llm_model,
-                'temperature': self.config.temperature
+                'temperature': self.config.temperature,
+                'cache_responses': self.config.cache_responses
             }
             
             # Use factory to create specialized agent node
@@ -44,6 +52,19 @@ class DebateGraphBuilder:
         
         return self
     
+    def add_round_executor(self):
+        """Add round executor node, which runs all agents of a round concurrently"""
+        executor_config = {
+            'llm_model': self.config.llm_model,
+            'temperature': self.config.temperature,
+            'max_concurrent': self.config.max_concurrent,
+            'cache_responses': self.config.cache_responses
+        }
+        round_executor = RoundExecutorNode(executor_config)
+        self.graph.add_node("round_executor", round_executor)
+        self.nodes["round_executor"] = round_executor
+        return self
+    
     def add_round_controller(self):
         """Add round controller node"""
         round_controller = RoundControllerNode()
@@ -62,7 +83,10 @@ class DebateGraphBuilder:
         """Add judge node"""
         judge_config = {
             'judge_model': self.config.judge_model,
-            'judge_temperature': self.config.judge_temperature
+            'judge_temperature': self.config.judge_temperature,
+            'judge_max_tokens': self.config.judge_max_tokens,
+            'stream_judgment': self.config.stream_judgment,
+            'cache_responses': self.config.cache_responses
         }
         judge_node = JudgeNode(judge_config)
         self.graph.add_node("judge", judge_node)
@@ -83,6 +107,22 @@ class DebateGraphBuilder:
         return router
     # ---------------------------
     
+    def build_parallel_flow(self):
+        """Build the graph flow with one concurrent round executor instead of per-agent nodes"""
+        self.graph.set_entry_point("user_input")
+        self.graph.add_edge("user_input", "round_executor")
+        self.graph.add_edge("round_executor", "round_controller")
+        
+        self.graph.add_conditional_edges(
+            "round_controller",
+            lambda state: "judge" if state.get('debate_complete') else "round_executor",
+            {"round_executor": "round_executor", "judge": "judge"}
+        )
+        
+        self.graph.add_edge("judge", END)
+        
+        return self.graph.compile()
+    
     def build_flow(self, agent_ids: List[str] = None):
         """Build the complete graph flow"""
         if agent_ids is None:
@@ -124,6 +164,14 @@ class DebateGraphBuilder:
         if agent_ids is None:
             agent_ids = self.config.default_agents
         
+        if self.config.parallel_rounds:
+            return (self
+                    .add_user_input()
+                    .add_round_executor()
+                    .add_round_controller()
+                    .add_judge()
+                    .build_parallel_flow())
+        
         return (self
                 .add_user_input()
                 .add_agents(agent_ids)
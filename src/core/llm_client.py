@@ -0,0 +1,145 @@
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
+from langchain_core.rate_limiters import BaseRateLimiter
+import asyncio
+import threading
+import time
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+class TokenBucketRateLimiter(BaseRateLimiter):
+    """Client-side limiter for OpenAI's requests-per-minute and tokens-per-minute quotas
+    
+    Two token buckets refill continuously at rpm/60 and tpm/60 per second.
+    Each request takes one request token plus an estimate of the tokens it
+    will use, so calls are paced at the quota instead of bursting into 429s.
+    A quota of 0 or None leaves that bucket unlimited.
+    """
+    
+    def __init__(self, requests_per_minute: Optional[int], tokens_per_minute: Optional[int] = None,
+                 tokens_per_request: int = 1000, check_every_n_seconds: float = 0.1):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.tokens_per_request = tokens_per_request
+        self.check_every_n_seconds = check_every_n_seconds
+        self._requests = float(requests_per_minute or 0)
+        self._tokens = float(tokens_per_minute or 0)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        """Top both buckets up for the time elapsed since the last call"""
+        now = time.monotonic()
+        elapsed, self._last = now - self._last, now
+        if self.requests_per_minute:
+            self._requests = min(self.requests_per_minute,
+                                 self._requests + elapsed * self.requests_per_minute / 60)
+        if self.tokens_per_minute:
+            self._tokens = min(self.tokens_per_minute,
+                               self._tokens + elapsed * self.tokens_per_minute / 60)
+    
+    def _consume(self) -> bool:
+        with self._lock:
+            self._refill()
+            needed = min(self.tokens_per_request, self.tokens_per_minute or 0)
+            if (self.requests_per_minute and self._requests < 1) or self._tokens < needed:
+                return False
+            if self.requests_per_minute:
+                self._requests -= 1
+            self._tokens -= needed
+            return True
+    
+    def acquire(self, *, blocking: bool = True) -> bool:
+        if not blocking:
+            return self._consume()
+        while not self._consume():
+            time.sleep(self.check_every_n_seconds)
+        return True
+    
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        if not blocking:
+            return self._consume()
+        while not self._consume():
+            await asyncio.sleep(self.check_every_n_seconds)
+        return True
+    
+    def reserve_tokens(self, count: int):
+        """Block until count tokens (capped at the TPM quota) can be taken from the TPM bucket"""
+        if not self.tokens_per_minute:
+            return
+        count = min(count, self.tokens_per_minute)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= count:
+                    self._tokens -= count
+                    return
+            time.sleep(self.check_every_n_seconds)
+
+# Shared by every chat model; set through configure_llm_client()
+_rate_limiter: Optional[TokenBucketRateLimiter] = None
+_max_retries = 2
+
+def configure_llm_client(requests_per_minute: int = 0, tokens_per_minute: int = 0,
+                         max_retries: int = 2):
+    """Set the rate limits and retry budget used by all chat models
+    
+    A limit of 0 disables client-side pacing. Retries on 429 and 5xx
+    responses use the OpenAI client's exponential backoff with jitter.
+    """
+    global _rate_limiter, _max_retries
+    _rate_limiter = (
+        TokenBucketRateLimiter(requests_per_minute or None, tokens_per_minute or None)
+        if requests_per_minute > 0 or tokens_per_minute > 0 else None
+    )
+    _max_retries = max_retries
+    # Models created under the previous settings must not be reused
+    get_chat_model.cache_clear()
+
+def reserve_tokens(text: str, model: str):
+    """Pre-reserve TPM budget for a large prompt
+    
+    A no-op without a configured TPM limit; the text is only tokenized
+    when there is a limit to reserve against.
+    """
+    if _rate_limiter is not None and _rate_limiter.tokens_per_minute:
+        _rate_limiter.reserve_tokens(count_tokens(text, model))
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """tiktoken encoding for model, or None if tiktoken or its BPE file is unavailable"""
+    try:
+        import tiktoken
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Missing package, or no network to fetch the encoding on first use
+        return None
+
+def count_tokens(text: str, model: str) -> int:
+    """Number of tokens text takes for model (about 4 characters per token without tiktoken)"""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text))
+
+@lru_cache(maxsize=None)
+def get_chat_model(model: str, temperature: float, max_tokens: Optional[int] = None) -> "ChatOpenAI":
+    """Get a shared chat model client for a (model, temperature, max_tokens) combination
+    
+    Agents with the same configuration reuse one ChatOpenAI instance and
+    therefore one HTTP connection pool. langchain_openai (and with it the
+    openai SDK and httpx) is only imported here, on the first LLM call.
+    """
+    from langchain_openai import ChatOpenAI
+    
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        max_retries=_max_retries,
+        rate_limiter=_rate_limiter
+    )
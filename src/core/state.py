@@ -1,7 +1,8 @@
-from typing import Dict, List, Any, Optional, TypedDict
+from typing import Dict, List, Set, Any, Optional, TypedDict, Deque, Annotated
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
+import operator
 
 class DebatePhase(str, Enum):
     """Debate phases - inherits from str for TypedDict compatibility"""
@@ -11,7 +12,15 @@ class DebatePhase(str, Enum):
     COMPLETE = "complete"
 
 class DebateState(TypedDict):
-    """Type definition for debate state"""
+    """Type definition for debate state
+    
+    Nodes return only the keys they change and LangGraph merges them in.
+    The append-only lists use an operator.add reducer (operator.or_ for the
+    hash set), so a node returns just its new entries. The merge itself
+    still builds a new list or set each step: LangGraph applies a node's
+    writes to a copied channel to evaluate conditional edges, so the
+    reducers must not mutate their first argument in place.
+    """
     # Core debate properties
     topic: str
     current_round: int
@@ -22,12 +31,18 @@ class DebateState(TypedDict):
     agent_order: List[str]
     current_agent_index: int
     agent_configs: Dict[str, Any]
+    agent_names: Dict[str, str]  # agent_id -> display name, precomputed from agent_configs
     
     # Memory and content
-    agent_memories: Dict[str, List[str]]
-    full_transcript: List[Dict[str, Any]]
-    used_arguments: List[str]
+    agent_memories: Dict[str, Deque[str]]  # bounded by DebateConfig.max_memory_size
+    full_transcript: Annotated[List[Dict[str, Any]], operator.add]
+    used_arguments: Annotated[List[str], operator.add]
+    used_argument_hashes: Annotated[Set[int], operator.or_]  # argument_fingerprint() of used_arguments
+    used_argument_previews: Deque[str]  # recent used_arguments truncated for prompts
+    transcript_cached_text: str  # full_transcript rendered for the judge, extended each turn
     last_argument: str
+    unique_arguments_count: int  # used_arguments with a fingerprint not seen before
+    participant_contributions: Dict[str, int]  # speaker name -> number of arguments
     
     # Results
     judge_summary: str
@@ -1,9 +1,10 @@
 from core.graph_builder import DebateGraphBuilder
 from core.state import DebateState
 from config.settings import DebateConfig
-from utils.diagram_generator import save_graph_diagram, generate_simple_diagram
+from utils.diagram_generator import save_graph_diagram, generate_simple_diagram, diagram_up_to_date
 from utils.loggers import setup_logging, save_final_report, log_state_transition
 from dotenv import load_dotenv
+from collections import deque
 import os
 import sys
 
@@ -37,7 +38,7 @@ def main():
     config = DebateConfig(
         max_rounds=8,
         llm_model="gpt-3.5-turbo",
-        judge_model="gpt-4", 
+        judge_model="gpt-4o-mini",
         temperature=0.7,
         judge_temperature=0.3,
         default_agents=["scientist", "philosopher"]  # Default debate pair
@@ -54,9 +55,13 @@ def main():
         
         # Save visualization
         print("\n✓ Generating system diagram...")
+        # An existing diagram of the same graph is reused instead of re-rendered
+        diagram_path = "debate_system_diagram.png"
         try:
-            save_graph_diagram(graph, "debate_system_diagram.png")
-            print("  Diagram saved: debate_system_diagram.png")
+            if diagram_up_to_date(graph, diagram_path):
+                print(f"  Diagram up to date: {diagram_path}")
+            elif save_graph_diagram(graph, diagram_path):
+                print(f"  Diagram saved: {diagram_path}")
         except Exception as e:
             print(f"  Warning: Could not save diagram: {e}")
         
@@ -73,10 +78,16 @@ def main():
             agent_order=[],
             current_agent_index=0,
             agent_configs={},
+            agent_names={},
             agent_memories={},
             full_transcript=[],
             used_arguments=[],
+            used_argument_hashes=set(),
+            used_argument_previews=deque(),
+            transcript_cached_text="",
             last_argument="",
+            unique_arguments_count=0,
+            participant_contributions={},
             judge_summary="",
             winner="", 
             reasoning="",
@@ -3,11 +3,13 @@ from nodes.round_controller import RoundControllerNode
 from nodes.judge import JudgeNode
 from nodes.memory_manager import MemoryManagerNode
 from nodes.agent_factory import AgentNodeFactory  # Import the factory
+from nodes.round_executor import RoundExecutorNode
 
 __all__ = [
     'UserInputNode',
     'RoundControllerNode', 
     'JudgeNode',
     'MemoryManagerNode',
-    'AgentNodeFactory'  # Export the factory
+    'AgentNodeFactory',  # Export the factory
+    'RoundExecutorNode'
 ]
\ No newline at end of file
@@ -1,9 +1,33 @@
 from core.base_nodes import BaseAgentNode
 from core.state import DebateState
 from agents.agent_registry import agent_registry
-from datetime import datetime
+from utils.semantic_cache import response_cache
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 import logging
 
+def _hashable(value: Any) -> Any:
+    """Lists and dicts become tuples so config values can be part of a cache key"""
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    return value
+
+@lru_cache(maxsize=16)
+def _cached_create_agent(agent_id: str, agent_type: str, config_items: Tuple[Tuple[str, Any], ...]):
+    return agent_registry.create_agent(agent_id=agent_id, agent_type=agent_type, **dict(config_items))
+
+def create_agent_cached(agent_id: str, agent_type: str, config: Dict[str, Any]):
+    """Create an agent through the registry, reusing the instance for an identical config
+    
+    Rebuilding the graph with the same agents then skips the constructor
+    work. Call _cached_create_agent.cache_clear() after registering a new
+    agent class for an id that was already created.
+    """
+    config_items = tuple(sorted((key, _hashable(value)) for key, value in config.items()))
+    return _cached_create_agent(agent_id, agent_type, config_items)
+
 class AgentNodeFactory:
     """Factory for creating dynamic agent nodes"""
     
@@ -21,18 +45,14 @@ class AgentNodeFactory:
                 super().__init__(agent_id, config)
                 # Create the actual agent instance using registry
                 # Use agent_id as the agent_type since they correspond
-                self.agent = agent_registry.create_agent(
-                    agent_id=agent_id,
-                    agent_type=agent_id,
-                    **config
-                )
+                self.agent = create_agent_cached(agent_id, agent_id, config)
             
             def execute(self, state: DebateState) -> DebateState:
                 """Execute agent's turn in the debate"""
                 if not self.should_execute(state):
-                    return state
+                    return {}
                 
-                agent_name = self.get_agent_name()
+                agent_name = self.get_agent_name(state)
                 current_round = state['current_round']
                 
                 self.logger.info(f"ROUND {current_round + 1} - {agent_name.upper()} preparing argument...")
@@ -40,46 +60,35 @@ class AgentNodeFactory:
                 # Get this agent's memory context
                 memory = state['agent_memories'].get(self.agent_id, [])
                 
-                try:
-                    # Generate argument using the specific agent implementation
-                    argument = self.agent.generate_argument(
-                        state['topic'],
-                        memory,
-                        state['used_arguments']
-                    )
-                except Exception as e:
-                    self.logger.error(f"Error generating argument for {agent_name}: {e}")
-                    argument = f"[{agent_name} encountered an error generating argument]"
+                # Repeat debates on the same topic reuse earlier responses
+                use_cache = self.config.get('cache_responses', False)
+                cache_key = self.argument_cache_key(state, self.agent_id)
+                argument = response_cache.lookup(cache_key) if use_cache else None
                 
-                # Update all agent memories with this new argument
-                new_memories = self.update_memories(state, argument)
-                
-                # Add to transcript
-                new_transcript = state['full_transcript'] + [{
-                    'round': current_round + 1,
-                    'speaker': agent_name,
-                    'agent_id': self.agent_id,
-                    'argument': argument,
-                    'timestamp': str(datetime.now())
-                }]
+                if argument is None:
+                    try:
+                        # Generate argument using the specific agent implementation
+                        argument = self.agent.generate_argument(
+                            state['topic'],
+                            memory,
+                            state['used_arguments'],
+                            state.get('used_argument_previews'),
+                            state.get('used_argument_hashes')
+                        )
+                    except Exception as e:
+                        self.logger.error(f"Error generating argument for {agent_name}: {e}")
+                        argument = f"[{agent_name} encountered an error generating argument]"
+                    
+                    # Error placeholders are bracketed and never cached
+                    if use_cache and not argument.startswith('['):
+                        response_cache.put(cache_key, argument)
                 
                 # Move to next agent in rotation
                 next_agent_index = (state['current_agent_index'] + 1) % len(state['agent_order'])
                 
-                # Log the argument to transcript
-                self.logger.info(f"[Round {current_round + 1}] {agent_name}: {argument[:100]}...")
-                
-                # Also log to dedicated transcript file
-                from utils.loggers import log_argument
-                log_argument(current_round + 1, agent_name, argument)
-                
                 return {
-                    **state,
-                    'current_agent_index': next_agent_index,
-                    'agent_memories': new_memories,
-                    'full_transcript': new_transcript,
-                    'used_arguments': state['used_arguments'] + [argument],
-                    'last_argument': argument
+                    **self.record_arguments(state, [(self.agent_id, argument)], {self.agent_id: self.agent}),
+                    'current_agent_index': next_agent_index
                 }
         
         return DynamicAgentNode(agent_id, agent_config)
\ No newline at end of file
@@ -1,10 +1,48 @@
 from core.base_nodes import BaseNode
 from core.state import DebateState, DebatePhase
+from core.llm_client import get_chat_model, reserve_tokens
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
+from pydantic import BaseModel, Field, create_model
+from utils.semantic_cache import response_cache
 from datetime import datetime
+from functools import cached_property, lru_cache
+from typing import Literal, Tuple, Type
+import io
 import json
 import re
+import sys
+
+# Section and verdict keywords for the unstructured fallback parser
+_REASONING_RE = re.compile(r'reasoning|justification|decision', re.I)
+_WINNER_RE = re.compile(r'winner|wins|victory|prevails', re.I)
+
+class Judgment(BaseModel):
+    """Structured judgment returned by the judge LLM"""
+    summary: str = Field(description="A comprehensive summary of the debate (3-5 sentences)")
+    winner: str = Field(description="The exact name of the winning agent, or 'Tie'")
+    reasoning: str = Field(description="Detailed reasoning for your decision (4-6 sentences explaining why the winner prevailed)")
+
+@lru_cache(maxsize=None)
+def _judgment_schema(agent_names: Tuple[str, ...]) -> Type[Judgment]:
+    """Judgment model whose winner is restricted to the participants or 'Tie'"""
+    return create_model(
+        'Judgment',
+        __base__=Judgment,
+        winner=(Literal[agent_names + ('Tie',)], Field(description="The exact name of the winning agent, or 'Tie'"))
+    )
+
+# Judging rubric and output format; identical for every debate
+_JUDGE_SYSTEM_MESSAGE = """You are an impartial debate judge. Criteria:
+- Logic and reasoning
+- Evidence for claims
+- Relevance, no repetition
+- Persuasiveness
+- Staying in persona
+
+Reply with JSON only:
+{"summary": "3-5 sentences", "winner": "exact participant name or 'Tie'", "reasoning": "4-6 sentences on why the winner prevailed"}
+
+Participants, topic and transcript follow."""
 
 class JudgeNode(BaseNode):
     """Node to evaluate debate and declare winner"""
@@ -12,24 +50,40 @@ class JudgeNode(BaseNode):
     def __init__(self, config: dict = None):
         super().__init__("judge")
         self.config = config or {}
-        self.llm = ChatOpenAI(
-            model=self.config.get('judge_model', 'gpt-4'),
-            temperature=self.config.get('judge_temperature', 0.3)
+    
+    @cached_property
+    def llm(self):
+        """Judge chat model, created on first use so building the graph stays cheap"""
+        return get_chat_model(
+            self.config.get('judge_model', 'gpt-4o-mini'),
+            self.config.get('judge_temperature', 0.3),
+            max_tokens=self.config.get('judge_max_tokens', 600)
         )
     
     def execute(self, state: DebateState) -> DebateState:
         if not state['debate_complete'] or state['phase'] != DebatePhase.JUDGMENT:
-            return state
+            return {}
         
         self.logger.info("Evaluating debate and declaring winner...")
         
         # Build transcript and agent info
         transcript_text = self._build_transcript_text(state)
         agent_info = self._build_agent_info(state)
-        agent_names = [state['agent_configs'][agent_id]['name'] for agent_id in state['agent_order']]
+        names = state['agent_names']
+        agent_names = [names[agent_id] for agent_id in state['agent_order']]
+        
+        # Judgments are only reused for byte-identical transcripts; embeddings
+        # of long transcripts are too coarse for a similarity match
+        use_cache = self.config.get('cache_responses', False)
+        cache_key = f"{state['topic']}|{transcript_text}"
+        judgment = response_cache.lookup(cache_key, semantic=False) if use_cache else None
         
         try:
-            judgment = self._evaluate_debate(state['topic'], transcript_text, agent_info, agent_names)
+            if judgment is None:
+                reserve_tokens(transcript_text, self.config.get('judge_model', 'gpt-4o-mini'))
+                judgment = self._evaluate_debate(state['topic'], transcript_text, agent_info, agent_names)
+                if use_cache:
+                    response_cache.put(cache_key, judgment, semantic=False)
             self.logger.info(f"Judgment complete. Winner: {judgment['winner']}")
         except Exception as e:
             self.logger.error(f"Error during judgment: {e}")
@@ -40,7 +94,6 @@ class JudgeNode(BaseNode):
             }
         
         return {
-            **state,
             'judge_summary': judgment['summary'],
             'winner': judgment['winner'],
             'reasoning': judgment['reasoning'],
@@ -50,68 +103,120 @@ class JudgeNode(BaseNode):
     
     def _build_transcript_text(self, state: DebateState) -> str:
         """Build formatted transcript from debate history"""
-        return "\n".join([
-            f"Round {entry['round']} - {entry['speaker']}: {entry['argument']}"
-            for entry in state['full_transcript']
-        ])
+        # Agent nodes extend the rendered transcript as they speak
+        if state.get('transcript_cached_text'):
+            return state['transcript_cached_text']
+        
+        # Otherwise render it in one pass, without an intermediate list of lines
+        buf = io.StringIO()
+        w = buf.write
+        separator = ""
+        for entry in state['full_transcript']:
+            w(separator)
+            w("Round ")
+            w(str(entry['round']))
+            w(" - ")
+            w(entry['speaker'])
+            w(": ")
+            w(entry['argument'])
+            separator = "\n"
+        return buf.getvalue()
     
     def _build_agent_info(self, state: DebateState) -> str:
         """Build agent information summary"""
         agent_descriptions = []
+        names = state['agent_names']
         for agent_id in state['agent_order']:
             config = state['agent_configs'][agent_id]
             agent_descriptions.append(
-                f"{config['name']} ({config['persona']}): {config['description']}"
+                f"{names[agent_id]} ({config['persona']}): {config['description']}"
             )
         return "\n".join(agent_descriptions)
     
     def _evaluate_debate(self, topic: str, transcript: str, agent_info: str, agent_names: list) -> dict:
         """Evaluate the debate and determine winner using structured output"""
-        system_message = """You are an impartial debate judge. Evaluate arguments based on:
-        - Logical consistency and reasoning quality
-        - Evidence and support for claims
-        - Relevance to the topic and avoidance of repetition
-        - Persuasiveness and rhetorical quality
-        - Adherence to persona and perspective
-        
-        Provide a comprehensive summary and declare a clear winner with detailed justification."""
-        
-        # Create structured output request
+        # Static instructions first and per-debate content last, so repeated
+        # judgments share a byte-identical prefix for provider prompt caching
         agent_names_str = ", ".join(agent_names)
-        prompt = f"""
-        DEBATE TOPIC: {topic}
-        
-        PARTICIPANTS:
-        {agent_info}
-        
-        COMPLETE TRANSCRIPT:
-        {transcript}
-        
-        Please evaluate this debate and provide your judgment in the following JSON format:
-        {{
-            "summary": "A comprehensive summary of the debate (3-5 sentences)",
-            "winner": "The exact name of the winning agent (must be one of: {agent_names_str}) or 'Tie'",
-            "reasoning": "Detailed reasoning for your decision (4-6 sentences explaining why the winner prevailed)"
-        }}
-        
-        IMPORTANT: The "winner" field must contain EXACTLY one of these values: {agent_names_str}, or "Tie"
-        """
+        prompt = f"""PARTICIPANTS:
+{agent_info}
+
+The "winner" field must contain EXACTLY one of these values: {agent_names_str}, or "Tie"
+
+DEBATE TOPIC: {topic}
+
+COMPLETE TRANSCRIPT:
+{transcript}"""
         
         messages = [
-            SystemMessage(content=system_message),
+            SystemMessage(content=_JUDGE_SYSTEM_MESSAGE),
             HumanMessage(content=prompt)
         ]
         
-        response = self.llm.invoke(messages)
-        return self._parse_judgment(response.content, agent_names)
+        # strict=True makes OpenAI enforce the schema, including the winner enum.
+        # A JSON schema (rather than the model class) makes LangChain return
+        # plain dicts, and partial ones while streaming, so fields can be shown
+        # while they are generated
+        schema = _judgment_schema(tuple(agent_names))
+        try:
+            structured_llm = self.llm.with_structured_output(
+                schema.model_json_schema(), method="function_calling", strict=True
+            )
+            if self.config.get('stream_judgment', True):
+                judgment = self._stream_judgment(structured_llm, messages)
+            else:
+                judgment = structured_llm.invoke(messages)
+            return self._validate_judgment(schema, judgment, agent_names)
+        except Exception as e:
+            # Models without tool calling still get a best-effort text judgment
+            self.logger.warning(f"Structured judgment failed ({e}), falling back to text parsing")
+        
+        if not self.config.get('stream_judgment', True):
+            return self._parse_judgment(self.llm.invoke(messages).content, agent_names)
+        
+        chunks = []
+        for chunk in self.llm.stream(messages):
+            sys.stdout.write(chunk.content)
+            sys.stdout.flush()
+            chunks.append(chunk.content)
+        sys.stdout.write("\n")
+        return self._parse_judgment("".join(chunks), agent_names)
+    
+    def _validate_judgment(self, schema: Type[Judgment], judgment: dict, agent_names: list) -> dict:
+        """Validate a structured judgment, mapping an off-list winner to the closest participant
+        
+        Providers without strict schema support can still return a winner
+        like "The Scientist"; that is fixed here rather than by asking again.
+        """
+        winner = judgment.get('winner') or 'Tie'
+        if winner not in agent_names and winner != 'Tie':
+            winner = self._find_closest_agent_name(winner, agent_names)
+        return schema.model_validate({**judgment, 'winner': winner}).model_dump()
+    
+    def _stream_judgment(self, structured_llm, messages: list) -> dict:
+        """Stream the judgment to stdout field by field and return the final dict"""
+        judgment = {}
+        shown = {}
+        for judgment in structured_llm.stream(messages):
+            for field, value in judgment.items():
+                if not isinstance(value, str):
+                    continue
+                if field not in shown:
+                    sys.stdout.write(f"\n {field.upper()}: ")
+                    shown[field] = 0
+                sys.stdout.write(value[shown[field]:])
+                shown[field] = len(value)
+            sys.stdout.flush()
+        sys.stdout.write("\n")
+        return judgment
     
     def _parse_judgment(self, judgment_text: str, agent_names: list) -> dict:
         """Parse judgment from LLM response with robust extraction"""
         try:
-            # Try to extract JSON if present
-            json_match = re.search(r'\{[\s\S]*\}', judgment_text)
-            if json_match:
-                judgment_data = json.loads(json_match.group())
+            # Decode the first JSON object in the text, if present, in one pass
+            start = judgment_text.find('{')
+            if start >= 0:
+                judgment_data, _ = json.JSONDecoder().raw_decode(judgment_text, start)
                 
                 # Validate winner field
                 winner = judgment_data.get('winner', 'Tie')
@@ -150,11 +255,11 @@ class JudgeNode(BaseNode):
             if 'summary' in line_lower and len(line_stripped) < 50:
                 current_section = 'summary'
                 continue
-            elif any(word in line_lower for word in ['reasoning', 'justification', 'decision']) and len(line_stripped) < 50:
+            elif len(line_stripped) < 50 and _REASONING_RE.search(line_stripped):
                 current_section = 'reasoning'
                 continue
             elif 'winner' in line_lower and len(line_stripped) < 100:
-                # Extract winner from this line
+                # Extract winner from this line: the first agent, in agent order, it names
                 for name in agent_names:
                     if name.lower() in line_lower:
                         winner = name
@@ -167,10 +272,12 @@ class JudgeNode(BaseNode):
             elif current_section == 'reasoning':
                 reasoning_lines.append(line_stripped)
             else:
-                # Before sections are identified, look for winner
-                for name in agent_names:
-                    if name.lower() in line_lower and any(word in line_lower for word in ['winner', 'wins', 'victory', 'prevails']):
-                        winner = name
+                # Before sections are identified, look for winner; the last
+                # agent, in agent order, named on the line takes it
+                if _WINNER_RE.search(line_stripped):
+                    for name in agent_names:
+                        if name.lower() in line_lower:
+                            winner = name
         
         return {
             'summary': ' '.join(summary_lines) if summary_lines else judgment_text[:500],
@@ -1,5 +1,7 @@
 from core.base_nodes import BaseNode
 from core.state import DebateState
+from collections import deque
+from itertools import islice
 from typing import List, Dict
 import logging
 
@@ -11,23 +13,24 @@ class MemoryManagerNode(BaseNode):
         self.max_memory_size = max_memory_size
     
     def execute(self, state: DebateState) -> DebateState:
-        """Optimize memories by removing oldest entries if needed"""
-        if not state.get('agent_memories'):
-            return state
+        """Bound any unbounded memories to the most recent entries
+        
+        Memories created by UserInputNode are deques with a maxlen that
+        evict on append, so this is a no-op for them.
+        """
+        memories = state.get('agent_memories')
+        if not memories or all(getattr(memory, 'maxlen', None) is not None for memory in memories.values()):
+            return {}
         
         optimized_memories = {}
-        for agent_id, memory in state['agent_memories'].items():
-            # Keep only the most recent entries
-            if len(memory) > self.max_memory_size:
-                optimized_memory = memory[-self.max_memory_size:]
-                self.logger.info(f"Trimmed memory for {agent_id}: {len(memory)} -> {len(optimized_memory)}")
-            else:
-                optimized_memory = memory
-            
-            optimized_memories[agent_id] = optimized_memory
+        for agent_id, memory in memories.items():
+            if getattr(memory, 'maxlen', None) is None:
+                bounded = deque(memory, maxlen=self.max_memory_size)
+                self.logger.info(f"Bounded memory for {agent_id}: {len(memory)} -> {len(bounded)}")
+                memory = bounded
+            optimized_memories[agent_id] = memory
         
         return {
-            **state,
             'agent_memories': optimized_memories
         }
     
@@ -37,7 +40,8 @@ class MemoryManagerNode(BaseNode):
         
         # Always include the agent's own recent arguments
         if agent_id in memories:
-            relevant_memory.extend(memories[agent_id][-3:])
+            own = memories[agent_id]
+            relevant_memory.extend(islice(own, max(0, len(own) - 3), None))
         
         # Include recent arguments from other agents
         for other_agent, memory in memories.items():
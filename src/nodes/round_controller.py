@@ -13,18 +13,11 @@ class RoundControllerNode(BaseNode):
         For 8 rounds with 2 agents:
         - Each speaking turn is 1 round
         - Total of 8 speaking turns = 4 per agent
-        - Round increments after EACH agent speaks
+        - Round increments after EACH agent speaks (done by the agent node)
         """
         current_round = state['current_round']
         max_rounds = state['max_rounds']
         
-        # Count the number of arguments made so far
-        # Each argument = 1 round
-        total_arguments = len(state['full_transcript'])
-        
-        # Update current_round to match total arguments
-        current_round = total_arguments
-        
         # Check if debate is complete
         debate_complete = current_round >= max_rounds
         
@@ -34,8 +27,6 @@ class RoundControllerNode(BaseNode):
             self.logger.info(f"Round progress: {current_round}/{max_rounds}")
         
         return {
-            **state,
-            'current_round': current_round,
             'debate_complete': debate_complete,
             'phase': DebatePhase.JUDGMENT if debate_complete else DebatePhase.DEBATE
         }
\ No newline at end of file
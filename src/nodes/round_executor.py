@@ -0,0 +1,102 @@
+from core.base_nodes import BaseNode
+from core.state import DebateState
+from nodes.agent_factory import create_agent_cached
+from utils.semantic_cache import response_cache
+from typing import Any, Dict, List
+import asyncio
+import atexit
+
+class RoundExecutorNode(BaseNode):
+    """Node that runs one full round, with every agent speaking concurrently
+    
+    Replaces the one-agent-per-step alternation of agent nodes for debates
+    where agents don't need to see each other's argument from the same round.
+    Each agent builds its prompt from the state as it was at the start of the
+    round, so a round costs one LLM latency instead of one per agent.
+    
+    All rounds run on one event loop owned by the node: the shared chat
+    model's async client keeps its pooled connections bound to the loop
+    they were opened on, so a fresh asyncio.run() per round would leave
+    it with connections from a closed loop.
+    """
+    
+    def __init__(self, config: Dict[str, Any] = None):
+        super().__init__("round_executor")
+        self.config = config or {}
+        self.max_concurrent = self.config.get('max_concurrent', 4)
+        self.agents = {}
+        self._loop = None
+    
+    def _run(self, coroutine):
+        """Run coroutine to completion on the node's persistent event loop"""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            atexit.register(self._loop.close)
+        return self._loop.run_until_complete(coroutine)
+    
+    def _get_agent(self, agent_id: str):
+        """Create the agent for agent_id on first use"""
+        if agent_id not in self.agents:
+            self.agents[agent_id] = create_agent_cached(agent_id, agent_id, {
+                'llm_model': self.config.get('llm_model', 'gpt-3.5-turbo'),
+                'temperature': self.config.get('temperature', 0.7)
+            })
+        return self.agents[agent_id]
+    
+    def execute(self, state: DebateState) -> DebateState:
+        """Generate this round's arguments for all agents and record them in order"""
+        if state['debate_complete']:
+            return {}
+        
+        # Only as many agents as there are turns left speak this round
+        remaining = state['max_rounds'] - len(state['full_transcript'])
+        speakers = state['agent_order'][:remaining]
+        
+        self.logger.info(f"ROUND {state['current_round'] + 1} - {len(speakers)} agents preparing arguments...")
+        
+        arguments = self._run(self._execute_round(state, speakers))
+        
+        spoken = []
+        for agent_id, argument in zip(speakers, arguments):
+            if isinstance(argument, BaseException):
+                agent_name = state['agent_names'][agent_id]
+                self.logger.error(f"Error generating argument for {agent_name}: {argument}")
+                argument = f"[{agent_name} encountered an error generating argument]"
+            spoken.append((agent_id, argument))
+        
+        return {
+            **self.record_arguments(state, spoken, self.agents),
+            'current_agent_index': 0
+        }
+    
+    async def _execute_round(self, state: DebateState, speakers: List[str]) -> List[Any]:
+        """Await all speakers' arguments, at most max_concurrent requests at a time"""
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        used_arguments = state['used_arguments']
+        used_previews = state.get('used_argument_previews')
+        used_hashes = state.get('used_argument_hashes')
+        # Same cache keys as the agent nodes; every speaker of a round answers
+        # the argument that closed the previous round
+        use_cache = self.config.get('cache_responses', False)
+        
+        async def generate(agent_id: str) -> str:
+            agent = self._get_agent(agent_id)
+            cache_key = self.argument_cache_key(state, agent_id)
+            if use_cache:
+                argument = response_cache.lookup(cache_key)
+                if argument is not None:
+                    return argument
+            async with semaphore:
+                argument = await agent.agenerate_argument(
+                    state['topic'],
+                    state['agent_memories'].get(agent_id, []),
+                    used_arguments,
+                    used_previews,
+                    used_hashes
+                )
+            if use_cache and not argument.startswith('['):
+                response_cache.put(cache_key, argument)
+            return argument
+        
+        return await asyncio.gather(*(generate(agent_id) for agent_id in speakers),
+                                    return_exceptions=True)
@@ -2,7 +2,9 @@ from core.base_nodes import BaseNode
 from core.state import DebateState, DebatePhase
 from config.settings import DebateConfig
 from agents.agent_registry import agent_registry
+from collections import deque
 from datetime import datetime
+import sys
 
 class UserInputNode(BaseNode):
     """Node to handle user input and initialize debate"""
@@ -21,7 +23,7 @@ class UserInputNode(BaseNode):
             Updated state with topic and agent configuration
         """
         if state.get('topic'):
-            return state  # Already initialized
+            return {}  # Already initialized
         
         # Get topic from user
         print("\n" + "=" * 70)
@@ -70,10 +72,13 @@ class UserInputNode(BaseNode):
             self.logger.error(f"Error creating agents: {e}")
             raise Exception(f"Failed to create debate agents: {e}")
         
+        # Agent ids are compared and used as dict keys on every turn, so intern them
+        selected_agents = [sys.intern(agent_id) for agent_id in selected_agents]
+        
         # Build agent configs from created agents
         agent_configs = {}
         for agent_id, agent in agents.items():
-            agent_configs[agent_id] = {
+            agent_configs[sys.intern(agent_id)] = {
                 'name': agent.get_name(),
                 'persona': agent.get_persona(),
                 'description': agent.config.get('description', ''),
@@ -86,9 +91,12 @@ class UserInputNode(BaseNode):
         print(f"✓ Maximum rounds: {self.config.max_rounds}")
         print("=" * 70 + "\n")
         
-        # Initialize state
+        # Memories and prompt previews are bounded so long debates don't grow them
+        max_memory_size = self.config.max_memory_size
+        
+        # Initialize state; full_transcript and used_arguments are append-only
+        # and start out empty in the initial state
         return {
-            **state,
             'topic': topic,
             'current_round': 0,
             'max_rounds': self.config.max_rounds,
@@ -96,10 +104,13 @@ class UserInputNode(BaseNode):
             'agent_order': selected_agents,
             'current_agent_index': 0,
             'agent_configs': agent_configs,
-            'agent_memories': {agent_id: [] for agent_id in selected_agents},
-            'full_transcript': [],
-            'used_arguments': [],
+            'agent_names': {agent_id: config['name'] for agent_id, config in agent_configs.items()},
+            'agent_memories': {agent_id: deque(maxlen=max_memory_size) for agent_id in selected_agents},
+            'used_argument_previews': deque(maxlen=max_memory_size),
+            'transcript_cached_text': '',
             'last_argument': '',
+            'unique_arguments_count': 0,
+            'participant_contributions': {},
             'judge_summary': '',
             'winner': '',
             'reasoning': '',
@@ -2,6 +2,22 @@ import os
 import subprocess
 from typing import Optional
 
+def diagram_up_to_date(graph, output_path: str = "debate_system_diagram.png") -> bool:
+    """Check whether output_path was rendered from this graph's current structure
+    
+    save_graph_diagram writes the mermaid source next to the PNG, so an
+    identical source with a PNG rendered after it means nothing changed.
+    Drawing the mermaid text is local and cheap; rendering the PNG is not.
+    """
+    mmd_path = output_path.replace('.png', '.mmd')
+    try:
+        if os.path.getmtime(output_path) < os.path.getmtime(mmd_path):
+            return False  # the last render failed after the source was written
+        with open(mmd_path) as f:
+            return f.read() == graph.get_graph().draw_mermaid()
+    except OSError:
+        return False
+
 def save_graph_diagram(graph, output_path: str = "debate_system_diagram.png") -> bool:
     """Generate and save visual diagram of the debate graph"""
     try:
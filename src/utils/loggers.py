@@ -1,16 +1,118 @@
 import logging
 import os
 import json
+import sys
+import atexit
+import itertools
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional
 from core.state import DebateState
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# datetime.fromisoformat accepts a trailing 'Z' natively from Python 3.11
+_FROMISOFORMAT_HANDLES_Z = sys.version_info >= (3, 11)
+
+# Log and report filenames share one timestamp per run; files written
+# in the same run are told apart by a sequence number
+_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+_RUN_TIMESTAMP = datetime.now().strftime(_TIMESTAMP_FORMAT)
+_LOG_SEQ = itertools.count()
+_REPORT_SEQ = itertools.count()
+_TRANSCRIPT_SEQ = itertools.count()
+
+class TranscriptSink:
+    """JSONL file holding one debate's transcript, one entry per line
+    
+    Entries are written as they are produced, so the final report can
+    reference the file instead of serializing the whole transcript again.
+    """
+    
+    def __init__(self, path: str, buffering: int = 65536):
+        self.path = path
+        self._file = open(path, 'wb', buffering=buffering)
+        atexit.register(self.close)
+    
+    def append(self, entry: Dict[str, Any]):
+        """Write one transcript entry as a JSON line"""
+        if orjson is not None:
+            self._file.write(orjson.dumps(entry, default=str))
+        else:
+            self._file.write(json.dumps(entry, ensure_ascii=True, default=str).encode('utf-8'))
+        self._file.write(b'\n')
+    
+    def flush(self):
+        if not self._file.closed:
+            self._file.flush()
+    
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+            atexit.unregister(self.close)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Read the entries back, flushing pending writes first"""
+        self.flush()
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+
+# Sink for the current debate: opened by the debate's first transcript entry
+# in the directory set by setup_logging, and closed by save_final_report
+_transcript_dir: Optional[str] = None
+_transcript_sink: Optional[TranscriptSink] = None
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that buffers records and flushes only on errors and close
+    
+    The standard handler flushes after every record, costing one write()
+    per log line. Buffered records are flushed by logging.shutdown(), which
+    the logging module registers with atexit.
+    """
+    
+    def __init__(self, filename: str, mode: str = 'a', encoding: str = None, capacity: int = 65536):
+        self.capacity = capacity
+        self._emitting = False
+        super().__init__(filename, mode=mode, encoding=encoding)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.capacity,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record: logging.LogRecord):
+        # FileHandler.emit keeps its reopen guard; only its flush is skipped
+        self._emitting = True
+        try:
+            super().emit(record)
+        finally:
+            self._emitting = False
+        if record.levelno >= logging.ERROR:
+            self.flush()
+    
+    def flush(self):
+        if not self._emitting:
+            super().flush()
+
+def _reset_handlers(logger: logging.Logger):
+    """Close and remove a logger's handlers, so a new debate releases the old log files
+    
+    Handlers shared between loggers may be closed more than once, which
+    logging allows.
+    """
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
+
 def setup_logging(log_dir: str = "debate_logs", level: int = logging.INFO):
     """Setup comprehensive logging configuration"""
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = f"{_RUN_TIMESTAMP}_{next(_LOG_SEQ)}"
     
     # Configure root logger first
     root_logger = logging.getLogger()
@@ -21,10 +123,10 @@ def setup_logging(log_dir: str = "debate_logs", level: int = logging.INFO):
     transcript_logger.setLevel(level)
     transcript_logger.propagate = False  # Don't propagate to root
     
-    # Clear any existing handlers
-    transcript_logger.handlers.clear()
+    # Close and clear any existing handlers
+    _reset_handlers(transcript_logger)
     
-    transcript_handler = logging.FileHandler(
+    transcript_handler = BufferedFileHandler(
         os.path.join(log_dir, f"debate_transcript_{timestamp}.log"),
         mode='w',
         encoding='utf-8'
@@ -46,10 +148,10 @@ def setup_logging(log_dir: str = "debate_logs", level: int = logging.INFO):
     state_logger.setLevel(logging.DEBUG)
     state_logger.propagate = False  # Don't propagate to root
     
-    # Clear any existing handlers
-    state_logger.handlers.clear()
+    # Close and clear any existing handlers
+    _reset_handlers(state_logger)
     
-    state_handler = logging.FileHandler(
+    state_handler = BufferedFileHandler(
         os.path.join(log_dir, f"state_transitions_{timestamp}.log"),
         mode='w',
         encoding='utf-8'
@@ -60,27 +162,15 @@ def setup_logging(log_dir: str = "debate_logs", level: int = logging.INFO):
     state_handler.setFormatter(state_formatter)
     state_logger.addHandler(state_handler)
     
-    # Node loggers (for each node type)
-    for node_name in ['user_input', 'round_controller', 'judge', 'memory_manager', 'agent_factory']:
+    # Node loggers (for each node type) share the transcript logger's file
+    # and console handlers, so the transcript file is opened only once
+    for node_name in ['user_input', 'round_controller', 'round_executor', 'judge', 'memory_manager', 'agent_factory']:
         node_logger = logging.getLogger(f'node.{node_name}')
         node_logger.setLevel(logging.DEBUG)
         node_logger.propagate = False
-        node_logger.handlers.clear()
-        
-        # Add file handler
-        node_handler = logging.FileHandler(
-            os.path.join(log_dir, f"debate_transcript_{timestamp}.log"),
-            mode='a',
-            encoding='utf-8'
-        )
-        node_handler.setFormatter(transcript_formatter)
-        node_logger.addHandler(node_handler)
-        
-        # Add console handler
-        node_console = logging.StreamHandler()
-        node_console.setLevel(logging.INFO)
-        node_console.setFormatter(logging.Formatter('%(message)s'))
-        node_logger.addHandler(node_console)
+        _reset_handlers(node_logger)
+        node_logger.addHandler(transcript_handler)
+        node_logger.addHandler(console_handler)
     
     # Log initialization
     transcript_logger.info("=" * 70)
@@ -90,12 +180,18 @@ def setup_logging(log_dir: str = "debate_logs", level: int = logging.INFO):
     
     state_logger.debug("State transition logging initialized")
     
+    # Transcript entries are streamed to a JSONL file per debate as it runs
+    global _transcript_dir, _transcript_sink
+    _transcript_dir = log_dir
+    if _transcript_sink is not None:
+        _transcript_sink.close()
+        _transcript_sink = None
+    
     return transcript_logger, state_logger
 
 def save_final_report(state: DebateState, log_dir: str = "debate_logs"):
     """Save comprehensive debate report"""
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
     
     report = {
         'metadata': {
@@ -115,85 +211,125 @@ def save_final_report(state: DebateState, log_dir: str = "debate_logs"):
         },
         'performance_metrics': {
             'total_arguments': len(state['used_arguments']),
-            'unique_arguments': len(set(state['used_arguments'])),
-            'participant_contributions': count_contributions(state['full_transcript'])
+            'unique_arguments': state['unique_arguments_count'],
+            'participant_contributions': state['participant_contributions']
         },
-        'full_transcript': state['full_transcript'],
-        'configuration': state.get('config', {})
+        'configuration': _jsonable(state.get('config', {}))
     }
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # The transcript itself lives in the debate's JSONL sink; the report only
+    # points at it, and the sink is closed so the next debate gets its own file
+    global _transcript_sink
+    sink, _transcript_sink = _transcript_sink, None
+    if sink is not None:
+        sink.close()
+        report['full_transcript_path'] = sink.path
+        transcript_entries = sink
+    else:
+        report['full_transcript'] = state['full_transcript']
+        transcript_entries = state['full_transcript']
+    
+    timestamp = f"{_RUN_TIMESTAMP}_{next(_REPORT_SEQ)}"
     filename = os.path.join(log_dir, f"debate_report_{timestamp}.json")
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # Serializes straight to UTF-8 bytes; default= covers anything else in the config
+        data = orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        # ASCII-escaped output encodes trivially and goes out in one write
+        data = json.dumps(report, indent=2, ensure_ascii=True, default=str).encode('utf-8')
+    with open(filename, 'wb') as f:
+        f.write(data)
     
     print(f"\nFull debate report saved to: {filename}")
     
     # Also save a text version of the transcript
     text_filename = os.path.join(log_dir, f"debate_transcript_final_{timestamp}.txt")
+    # Assemble the whole file first so it goes out in a single write
+    chunks = [
+        "=" * 70 + "\n",
+        "DEBATE TRANSCRIPT\n",
+        "=" * 70 + "\n\n",
+        f"Topic: {state['topic']}\n",
+        f"Participants: {', '.join(state['agent_order'])}\n",
+        f"Rounds: {state['current_round']}/{state['max_rounds']}\n",
+        f"Duration: {report['metadata']['duration_minutes']} minutes\n",
+        "\n" + "=" * 70 + "\n",
+        "ARGUMENTS\n",
+        "=" * 70 + "\n\n"
+    ]
+    
+    for entry in transcript_entries:
+        chunks.append(f"[Round {entry['round']}] {entry['speaker']}:\n{entry['argument']}\n\n")
+    
+    chunks.extend([
+        "=" * 70 + "\n",
+        "JUDGMENT\n",
+        "=" * 70 + "\n\n",
+        f"Summary:\n{state['judge_summary']}\n\n",
+        f"Winner: {state['winner']}\n\n",
+        f"Reasoning:\n{state['reasoning']}\n"
+    ])
+    
     with open(text_filename, 'w', encoding='utf-8') as f:
-        f.write("=" * 70 + "\n")
-        f.write("DEBATE TRANSCRIPT\n")
-        f.write("=" * 70 + "\n\n")
-        f.write(f"Topic: {state['topic']}\n")
-        f.write(f"Participants: {', '.join(state['agent_order'])}\n")
-        f.write(f"Rounds: {state['current_round']}/{state['max_rounds']}\n")
-        f.write(f"Duration: {report['metadata']['duration_minutes']} minutes\n")
-        f.write("\n" + "=" * 70 + "\n")
-        f.write("ARGUMENTS\n")
-        f.write("=" * 70 + "\n\n")
-        
-        for entry in state['full_transcript']:
-            f.write(f"[Round {entry['round']}] {entry['speaker']}:\n")
-            f.write(f"{entry['argument']}\n\n")
-        
-        f.write("=" * 70 + "\n")
-        f.write("JUDGMENT\n")
-        f.write("=" * 70 + "\n\n")
-        f.write(f"Summary:\n{state['judge_summary']}\n\n")
-        f.write(f"Winner: {state['winner']}\n\n")
-        f.write(f"Reasoning:\n{state['reasoning']}\n")
+        f.write(''.join(chunks))
     
     print(f"Text transcript saved to: {text_filename}")
     
     return filename
 
+def _jsonable(obj: Any) -> Any:
+    """Copy of obj made only of JSON types, with anything opaque replaced by its repr"""
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, dict):
+        return {str(key): _jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(item) for item in obj]
+    return repr(obj)
+
 def calculate_duration(start_time: str, end_time: str) -> float:
     """Calculate debate duration in minutes"""
     try:
-        start = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-        end = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+        if not _FROMISOFORMAT_HANDLES_Z:
+            start_time = start_time.replace('Z', '+00:00')
+            end_time = end_time.replace('Z', '+00:00')
+        start = datetime.fromisoformat(start_time)
+        end = datetime.fromisoformat(end_time)
         duration = (end - start).total_seconds() / 60
         return round(duration, 2)
     except:
         return 0.0
 
-def count_contributions(transcript: list) -> Dict[str, int]:
-    """Count contributions by each participant"""
-    contributions = {}
-    for entry in transcript:
-        speaker = entry['speaker']
-        contributions[speaker] = contributions.get(speaker, 0) + 1
-    return contributions
-
 def log_state_transition(node_name: str, state: DebateState):
     """Log state transition for debugging"""
     logger = logging.getLogger('state')
     
-    agent_index = state.get('current_agent_index', 0)
-    agent_order = state.get('agent_order', [])
-    current_agent = agent_order[agent_index] if agent_order and agent_index < len(agent_order) else 'unknown'
-    
-    logger.debug(f"Node: {node_name} | Round: {state.get('current_round', 0)} | "
-                f"Current Agent: {current_agent} | "
-                f"Phase: {state.get('phase', 'unknown')}")
+    # Skip the lookups and formatting entirely when debug output is off
+    if logger.isEnabledFor(logging.DEBUG):
+        agent_index = state.get('current_agent_index', 0)
+        agent_order = state.get('agent_order', [])
+        current_agent = agent_order[agent_index] if agent_order and agent_index < len(agent_order) else 'unknown'
+        
+        logger.debug("Node: %s | Round: %s | Current Agent: %s | Phase: %s",
+                     node_name, state.get('current_round', 0), current_agent,
+                     state.get('phase', 'unknown'))
     
     # Also log to transcript if it's an important transition
     if node_name in ['user_input', 'judge'] or node_name.startswith('agent_'):
         transcript_logger = logging.getLogger('transcript')
         transcript_logger.info(f"--- {node_name.upper()} NODE EXECUTED ---")
 
+def log_transcript_entry(entry: Dict[str, Any]):
+    """Append a transcript entry to the debate's JSONL sink, opening it for a new debate"""
+    global _transcript_sink
+    if _transcript_sink is None:
+        if _transcript_dir is None:
+            return  # setup_logging was not called
+        path = os.path.join(_transcript_dir, f"debate_transcript_{_RUN_TIMESTAMP}_{next(_TRANSCRIPT_SEQ)}.jsonl")
+        _transcript_sink = TranscriptSink(path)
+    _transcript_sink.append(entry)
+
 def log_argument(round_num: int, agent_name: str, argument: str):
     """Log an argument to transcript"""
     logger = logging.getLogger('transcript')
@@ -0,0 +1,82 @@
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class SemanticCache:
+    """Response cache with an exact tier and an optional semantic tier
+
+    Keys are first looked up by SHA-256 digest. On a miss, if
+    sentence-transformers is installed, the key is embedded and compared
+    against all stored keys with a single matrix product; the best match is
+    returned when its cosine similarity reaches the threshold.
+    """
+
+    def __init__(self, threshold: float = 0.95, model_name: str = "all-MiniLM-L6-v2"):
+        self.threshold = threshold
+        self.model_name = model_name
+        self._exact: Dict[str, Any] = {}
+        self._values: List[Any] = []
+        self._embeddings = None  # (n, d) array of L2-normalized key embeddings
+        self._encoder = None
+        self._encoder_loaded = False
+
+    @staticmethod
+    def _digest(key: str) -> str:
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def _get_encoder(self):
+        """Load the embedding model on first use; None if unavailable"""
+        if not self._encoder_loaded:
+            self._encoder_loaded = True
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._encoder = SentenceTransformer(self.model_name)
+            except Exception as e:
+                logger.info(f"Semantic cache tier disabled ({e}); using exact matches only")
+        return self._encoder
+
+    def _embed(self, key: str):
+        encoder = self._get_encoder()
+        if encoder is None:
+            return None
+        return encoder.encode([key], normalize_embeddings=True)[0]
+
+    def lookup(self, key: str, semantic: bool = True) -> Optional[Any]:
+        """Return the cached value for key (or a near-identical key), else None"""
+        value = self._exact.get(self._digest(key))
+        if value is not None or not semantic or self._embeddings is None:
+            return value
+
+        query = self._embed(key)
+        if query is None:
+            return None
+        scores = self._embeddings @ query
+        best = int(scores.argmax())
+        if scores[best] >= self.threshold:
+            return self._values[best]
+        return None
+
+    def put(self, key: str, value: Any, semantic: bool = True):
+        """Store value under key, indexing its embedding when semantic lookups are enabled"""
+        self._exact[self._digest(key)] = value
+        if not semantic:
+            return
+
+        embedding = self._embed(key)
+        if embedding is None:
+            return
+        import numpy as np
+        row = embedding.reshape(1, -1)
+        self._embeddings = row if self._embeddings is None else np.vstack([self._embeddings, row])
+        self._values.append(value)
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._exact.clear()
+        self._values.clear()
+        self._embeddings = None
+
+# Process-wide cache for LLM responses (agent arguments and judgments)
+response_cache = SemanticCache()
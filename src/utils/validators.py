@@ -1,7 +1,39 @@
 import re
-from typing import List, Set
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Set, Optional, AbstractSet, Deque, Tuple
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz import fuzz
+except ImportError:  # rapidfuzz is optional; it only speeds up is_novel
+    fuzz = None
+
+@lru_cache(maxsize=2048)
+def _normalize_cached(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace
+    
+    Memoized because every validation re-normalizes the same recent
+    arguments; a debate only has a few hundred distinct texts.
+    """
+    text = text.lower()
+    text = re.sub(r'[^\w\s]', '', text)
+    return ' '.join(text.split())
+
+def argument_fingerprint(argument: str) -> int:
+    """Hash of an argument's normalized text, for O(1) exact-repeat checks"""
+    return hash(_normalize_cached(argument))
+
+@dataclass
+class _WordStats:
+    """Word counts and flags gathered by ArgumentValidator._analyze"""
+    word_count: int
+    char_count: int
+    substantive_count: int  # words left after removing filler phrases
+    unique_substantive_count: int
+    has_connector: bool
+
 class ArgumentValidator:
     """Validates debate arguments for quality and novelty"""
     
@@ -9,50 +41,111 @@ class ArgumentValidator:
         self.min_length = min_length
         self.max_similarity = max_similarity
         self.min_words = min_words  # Added for compatibility
+        
+        # Quality indicators as one alternation, so a single search covers them all
+        quality_indicators = [
+            'because', 'therefore', 'however',
+            'evidence', 'research', 'studies',
+            'data', 'analysis', 'according',
+            'should', 'must', 'would'
+        ]
+        self._quality_re = re.compile(r'\b(?:' + '|'.join(quality_indicators) + r')\b')
+        # Filler phrases stripped by has_substance, removed in a single substitution
+        filler_phrases = [
+            "i think", "i believe", "in my opinion", "it seems to me",
+            "let me say", "as we know", "generally speaking"
+        ]
+        self._filler_re = re.compile('|'.join(map(re.escape, filler_phrases)))
+        # [placeholder text], <placeholder>, TODO markers and [Error messages, in one pass
+        self._placeholder_re = re.compile(r'\[.*?\]|<.*?>|TODO|FIXME|XXX|\[Error', re.IGNORECASE)
+        # (argument, normalized text) of the last 5 used arguments,
+        # kept in step with used_arguments by record_accepted
+        self._recent_normalized: Deque[Tuple[str, str]] = deque(maxlen=5)
     
-    def is_valid_argument(self, argument: str, used_arguments: List[str]) -> bool:
-        """Check if argument meets quality standards"""
+    def is_valid_argument(self, argument: str, used_arguments: List[str],
+                          used_hashes: Optional[AbstractSet[int]] = None) -> bool:
+        """Check if argument meets quality standards
+        
+        The length, substance and relevance checks share one pass over the
+        text (see _analyze), and the similarity scan in is_novel only runs
+        for arguments that pass everything else.
+        """
+        if not argument or not isinstance(argument, str):
+            return False
+        
+        stats = self._analyze(argument)
         return (
-            self.has_minimum_length(argument) and
-            self.has_substance(argument) and 
-            self.is_novel(argument, used_arguments) and
-            self.is_relevant(argument) and
-            not self._is_placeholder(argument)  # Added check
+            self._long_enough(stats) and
+            not self._is_placeholder(argument) and  # Added check
+            self._substantive(stats) and
+            stats.has_connector and
+            self.is_novel(argument, used_arguments, used_hashes=used_hashes)
         )
     
+    def _analyze(self, argument: str) -> _WordStats:
+        """Gather what has_minimum_length, has_substance and is_relevant check, lowercasing once"""
+        argument_lower = argument.lower()
+        substantive_words = self._filler_re.sub("", argument_lower).split()
+        return _WordStats(
+            word_count=len(argument_lower.split()),
+            char_count=len(argument.strip()),
+            substantive_count=len(substantive_words),
+            unique_substantive_count=len(set(substantive_words)),
+            has_connector=self._quality_re.search(argument_lower) is not None
+        )
+    
+    def _long_enough(self, stats: _WordStats) -> bool:
+        return stats.word_count >= self.min_length and stats.char_count >= 20
+    
+    def _substantive(self, stats: _WordStats) -> bool:
+        # Enough distinct content must remain once filler phrases are removed
+        return stats.unique_substantive_count >= 5 and stats.substantive_count >= 8
+    
     def has_minimum_length(self, argument: str) -> bool:
         """Check if argument meets minimum length requirement"""
         if not argument or not isinstance(argument, str):
             return False
-        words = argument.split()
-        return len(words) >= self.min_length and len(argument.strip()) >= 20
+        return self._long_enough(self._analyze(argument))
     
     def has_substance(self, argument: str) -> bool:
         """Check if argument has substantive content"""
-        # Remove common filler phrases
-        filler_phrases = [
-            "i think", "i believe", "in my opinion", "it seems to me",
-            "let me say", "as we know", "generally speaking"
-        ]
-        
-        clean_argument = argument.lower()
-        for phrase in filler_phrases:
-            clean_argument = clean_argument.replace(phrase, "")
-        
-        # Check if substantial content remains
-        words = clean_argument.split()
-        unique_words = set(words)
-        return len(unique_words) >= 5 and len(words) >= 8
+        return self._substantive(self._analyze(argument))
     
-    def is_novel(self, argument: str, used_arguments: List[str]) -> bool:
-        """Check if argument is sufficiently different from previous ones"""
+    def is_novel(self, argument: str, used_arguments: List[str],
+                 used_hashes: Optional[AbstractSet[int]] = None) -> bool:
+        """Check if argument is sufficiently different from previous ones
+        
+        used_hashes holds argument_fingerprint() of every used argument, so
+        exact repeats from anywhere in the debate are caught with one lookup
+        before the similarity scan of the recent arguments.
+        """
         if not used_arguments:
             return True
         
-        argument_clean = self.normalize_text(argument)
+        return self._is_novel_normalized(_normalize_cached(argument), used_arguments, used_hashes)
+    
+    def _is_novel_normalized(self, argument_clean: str, used_arguments: List[str],
+                             used_hashes: Optional[AbstractSet[int]] = None) -> bool:
+        """is_novel for an argument that has already been normalized"""
+        if used_hashes and hash(argument_clean) in used_hashes:
+            return False
         
-        for used_arg in used_arguments[-5:]:  # Check against last 5 arguments
-            used_clean = self.normalize_text(used_arg)
+        # SequenceMatcher's ratio is 2*M/T with M <= the shorter length, so
+        # 2*min/(len1+len2) bounds it from above (its real_quick_ratio);
+        # texts of very different length skip the full match
+        argument_length = len(argument_clean)
+        # rapidfuzz's ratio is 2*LCS/T, and difflib's matching blocks form a
+        # common subsequence, so it is a tighter (and much faster) upper bound
+        fuzz_floor = self.max_similarity * 100 - 1e-6
+        
+        for _, used_clean in self._recent_arguments(used_arguments):  # Last 5 arguments
+            used_length = len(used_clean)
+            total = argument_length + used_length
+            if total and 2 * min(argument_length, used_length) / total <= self.max_similarity:
+                continue
+            if fuzz is not None and fuzz.ratio(argument_clean, used_clean) < fuzz_floor:
+                continue
+            
             similarity = self.calculate_similarity(argument_clean, used_clean)
             
             if similarity > self.max_similarity:
@@ -60,54 +153,40 @@ class ArgumentValidator:
         
         return True
     
+    def record_accepted(self, argument: str):
+        """Remember an argument that joined used_arguments, normalized once for is_novel"""
+        self._recent_normalized.append((argument, _normalize_cached(argument)))
+    
+    def _recent_arguments(self, used_arguments: List[str]) -> Deque[Tuple[str, str]]:
+        """The recorded recent arguments, rebuilt if they don't match the end of used_arguments"""
+        recent = self._recent_normalized
+        count = min(len(used_arguments), recent.maxlen)
+        if len(recent) != count or any(recent[-i][0] != used_arguments[-i] for i in range(1, count + 1)):
+            recent.clear()
+            for i in range(count, 0, -1):
+                self.record_accepted(used_arguments[-i])
+        return recent
+    
     def is_relevant(self, argument: str) -> bool:
         """Basic relevance check - can be enhanced with topic analysis"""
-        # Check for common debate quality indicators
-        quality_indicators = [
-            r'\bbecause\b', r'\btherefore\b', r'\bhowever\b', 
-            r'\bevidence\b', r'\bresearch\b', r'\bstudies\b',
-            r'\bdata\b', r'\banalysis\b', r'\baccording\b',
-            r'\bshould\b', r'\bmust\b', r'\bwould\b'
-        ]
-        
-        argument_lower = argument.lower()
-        matches = sum(1 for indicator in quality_indicators 
-                     if re.search(indicator, argument_lower))
-        
-        return matches >= 1
+        # Check for common debate quality indicators; one match is enough
+        return self._analyze(argument).has_connector
     
     def _is_placeholder(self, argument: str) -> bool:
         """Check if argument contains placeholder text"""
-        placeholder_patterns = [
-            r'\[.*?\]',  # [placeholder text]
-            r'<.*?>',    # <placeholder>
-            r'TODO',
-            r'FIXME',
-            r'XXX',
-            r'\[Error',  # Error messages
-        ]
-        
-        arg_upper = argument.upper()
-        for pattern in placeholder_patterns:
-            if re.search(pattern, arg_upper):
-                return True
-        
-        return False
+        # Case-insensitive matching replaces upper-casing the whole argument
+        return self._placeholder_re.search(argument) is not None
     
     def normalize_text(self, text: str) -> str:
         """Normalize text for similarity comparison"""
-        # Convert to lowercase and remove punctuation
-        text = text.lower()
-        text = re.sub(r'[^\w\s]', '', text)
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        return text
+        return _normalize_cached(text)
     
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts using sequence matching"""
         return SequenceMatcher(None, text1, text2).ratio()
     
-    def get_validation_feedback(self, argument: str, used_arguments: List[str]) -> str:
+    def get_validation_feedback(self, argument: str, used_arguments: List[str],
+                                used_hashes: Optional[AbstractSet[int]] = None) -> str:
         """Get specific feedback on why an argument failed validation"""
         if not self.has_minimum_length(argument):
             return "Argument is too short. Please provide more detailed reasoning (at least 10 words, 20 characters)."
@@ -118,7 +197,7 @@ class ArgumentValidator:
         if not self.has_substance(argument):
             return "Argument lacks substantive content. Avoid filler phrases and provide concrete points."
         
-        if not self.is_novel(argument, used_arguments):
+        if not self.is_novel(argument, used_arguments, used_hashes=used_hashes):
             return "Argument is too similar to previous arguments. Please provide a novel perspective."
         
         if not self.is_relevant(argument):
@@ -126,9 +205,15 @@ class ArgumentValidator:
         
         return "Argument is valid."
     
-    def get_validation_errors(self, argument: str, used_arguments: List[str]) -> List[str]:
+    def get_validation_errors(self, argument: str, used_arguments: List[str],
+                              used_hashes: Optional[AbstractSet[int]] = None,
+                              early_exit: bool = False) -> List[str]:
         """Get detailed validation errors for an argument (for compatibility with base_agent.py)
         
+        Args:
+            early_exit: Stop after a length failure instead of running the
+                remaining checks, including the similarity scan
+        
         Returns:
             List of error messages (empty if valid)
         """
@@ -140,6 +225,8 @@ class ArgumentValidator:
         
         if not self.has_minimum_length(argument):
             errors.append(f"Argument too short (minimum {self.min_length} words, 20 characters)")
+            if early_exit:
+                return errors
         
         if self._is_placeholder(argument):
             errors.append("Argument contains placeholder or error text")
@@ -147,7 +234,7 @@ class ArgumentValidator:
         if not self.has_substance(argument):
             errors.append("Argument lacks substantive content")
         
-        if not self.is_novel(argument, used_arguments):
+        if not self.is_novel(argument, used_arguments, used_hashes=used_hashes):
             errors.append(f"Argument too similar to previous arguments (threshold: {self.max_similarity})")
         
         if not self.is_relevant(argument):
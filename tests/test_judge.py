@@ -0,0 +1,77 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from nodes.judge import JudgeNode
+
+
+class FakeStructuredLLM:
+    """Structured-output runnable returning a fixed judgment"""
+    
+    def __init__(self, judgment):
+        self.judgment = judgment
+    
+    def invoke(self, messages):
+        return dict(self.judgment)
+    
+    def stream(self, messages):
+        yield dict(self.judgment)
+
+
+class FakeJudgeLLM:
+    """Chat model whose structured output ignores the winner enum"""
+    
+    def __init__(self, judgment):
+        self.judgment = judgment
+        self.structured_kwargs = None
+        self.text_calls = 0
+    
+    def with_structured_output(self, schema, **kwargs):
+        self.structured_kwargs = kwargs
+        return FakeStructuredLLM(self.judgment)
+    
+    def invoke(self, messages):
+        self.text_calls += 1
+        raise AssertionError("text judgment path must not be used")
+    
+    stream = invoke
+
+
+class StructuredJudgmentTest(unittest.TestCase):
+    
+    def evaluate(self, stream_judgment):
+        judge = JudgeNode({'stream_judgment': stream_judgment})
+        llm = FakeJudgeLLM({'summary': 'Close debate.', 'winner': 'The Scientist', 'reasoning': 'Better evidence.'})
+        judge.__dict__['llm'] = llm
+        result = judge._evaluate_debate('AI regulation', 'transcript', 'info', ['Scientist', 'Philosopher'])
+        return llm, result
+    
+    def test_out_of_enum_winner_is_mapped_without_a_second_call(self):
+        for stream_judgment in (False, True):
+            llm, result = self.evaluate(stream_judgment)
+            self.assertEqual(result['winner'], 'Scientist')
+            self.assertEqual(result['summary'], 'Close debate.')
+            self.assertEqual(llm.text_calls, 0)
+            self.assertTrue(llm.structured_kwargs.get('strict'))
+
+
+class UnstructuredJudgmentTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.judge = JudgeNode.__new__(JudgeNode)
+    
+    def test_winner_line_prefers_agent_order(self):
+        text = "Winner: the Philosopher, narrowly ahead of the Scientist"
+        result = self.judge._parse_unstructured_judgment(text, ['Scientist', 'Philosopher'])
+        self.assertEqual(result['winner'], 'Scientist')
+    
+    def test_verdict_before_sections_takes_last_named_agent(self):
+        text = "The Scientist raised good data points, but the Philosopher wins this debate."
+        result = self.judge._parse_unstructured_judgment(text, ['Scientist', 'Philosopher'])
+        self.assertEqual(result['winner'], 'Philosopher')
+
+
+if __name__ == '__main__':
+    unittest.main()
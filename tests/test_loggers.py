@@ -0,0 +1,84 @@
+import json
+import logging
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils import loggers
+
+
+def finished_state(topic, speaker):
+    transcript = [
+        {'round': i + 1, 'speaker': speaker, 'agent_id': speaker.lower(), 'argument': f"{topic} point {i + 1}"}
+        for i in range(2)
+    ]
+    return {
+        'topic': topic,
+        'max_rounds': 2,
+        'current_round': 2,
+        'agent_order': [speaker.lower()],
+        'winner': speaker,
+        'judge_summary': 'summary',
+        'reasoning': 'reasoning',
+        'start_time': '2025-01-31T14:30:00',
+        'end_time': '2025-01-31T14:31:00',
+        'full_transcript': transcript,
+        'used_arguments': [entry['argument'] for entry in transcript],
+        'unique_arguments_count': 2,
+        'participant_contributions': {speaker: 2},
+        'config': {}
+    }
+
+
+class TranscriptSinkTest(unittest.TestCase):
+    
+    def test_each_debate_gets_its_own_transcript_file(self):
+        log_dir = tempfile.mkdtemp()
+        loggers.setup_logging(log_dir)
+        reports = []
+        for topic, speaker in [('Topic A', 'Scientist'), ('Topic B', 'Philosopher')]:
+            state = finished_state(topic, speaker)
+            for entry in state['full_transcript']:
+                loggers.log_transcript_entry(entry)
+            reports.append(loggers.save_final_report(state, log_dir))
+        
+        paths = []
+        for report_path, topic in zip(reports, ['Topic A', 'Topic B']):
+            with open(report_path) as f:
+                path = json.load(f)['full_transcript_path']
+            paths.append(path)
+            with open(path) as f:
+                arguments = [json.loads(line)['argument'] for line in f]
+            self.assertEqual(arguments, [f"{topic} point 1", f"{topic} point 2"])
+            with open(report_path.replace('debate_report_', 'debate_transcript_final_').replace('.json', '.txt')) as f:
+                text = f.read()
+            self.assertIn(f"{topic} point 1", text)
+            self.assertNotIn('Topic A' if topic == 'Topic B' else 'Topic B', text)
+        self.assertNotEqual(paths[0], paths[1])
+
+
+
+class SetupLoggingTest(unittest.TestCase):
+    
+    def test_setup_again_closes_previous_log_files(self):
+        log_dir = tempfile.mkdtemp()
+        loggers.setup_logging(log_dir)
+        old_handlers = logging.getLogger('transcript').handlers + logging.getLogger('state').handlers
+        old_files = [handler.baseFilename for handler in old_handlers if hasattr(handler, 'baseFilename')]
+        logging.getLogger('state').debug("buffered before the second setup")
+        
+        loggers.setup_logging(log_dir)
+        
+        self.assertEqual(len(old_files), 2)
+        for handler in old_handlers:
+            if hasattr(handler, 'baseFilename'):
+                self.assertIsNone(handler.stream)
+        with open(next(path for path in old_files if 'state_transitions_' in path)) as f:
+            self.assertIn("buffered before the second setup", f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
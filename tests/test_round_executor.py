@@ -0,0 +1,94 @@
+import asyncio
+import os
+import sys
+import unittest
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from nodes.round_executor import RoundExecutorNode
+from utils.semantic_cache import response_cache
+
+
+class LoopBoundAgent:
+    """Agent whose async client, like httpx's pool, stays tied to the first event loop"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.loop = None
+        self.calls = 0
+    
+    async def agenerate_argument(self, topic, memory, used_arguments, used_previews=None, used_hashes=None):
+        loop = asyncio.get_running_loop()
+        if self.loop is None:
+            self.loop = loop
+        elif self.loop is not loop:
+            raise RuntimeError("Event loop is closed")
+        self.calls += 1
+        await asyncio.sleep(0)
+        return f"{self.name} argument {self.calls} because the evidence says so"
+    
+    def record_argument(self, argument: str):
+        pass
+
+
+def initial_state(agent_ids, max_rounds):
+    return {
+        'topic': 'AI regulation',
+        'current_round': 0,
+        'max_rounds': max_rounds,
+        'agent_order': list(agent_ids),
+        'agent_names': {agent_id: agent_id.title() for agent_id in agent_ids},
+        'agent_memories': {agent_id: deque(maxlen=10) for agent_id in agent_ids},
+        'full_transcript': [],
+        'used_arguments': [],
+        'used_argument_hashes': set(),
+        'used_argument_previews': deque(maxlen=10),
+        'transcript_cached_text': '',
+        'last_argument': '',
+        'unique_arguments_count': 0,
+        'participant_contributions': {},
+        'debate_complete': False
+    }
+
+
+class RoundExecutorTest(unittest.TestCase):
+    
+    def test_rounds_share_one_event_loop(self):
+        agent_ids = ['scientist', 'philosopher']
+        node = RoundExecutorNode({'max_concurrent': 2})
+        node.agents = {agent_id: LoopBoundAgent(agent_id) for agent_id in agent_ids}
+        state = initial_state(agent_ids, max_rounds=6)
+        
+        for _ in range(3):
+            update = node.execute(state)
+            for key in ('full_transcript', 'used_arguments'):
+                update[key] = state[key] + update[key]
+            update['used_argument_hashes'] = state['used_argument_hashes'] | update['used_argument_hashes']
+            state = {**state, **update}
+        
+        arguments = [entry['argument'] for entry in state['full_transcript']]
+        self.assertEqual(len(arguments), 6)
+        self.assertFalse([argument for argument in arguments if argument.startswith('[')], arguments)
+        self.assertEqual(state['current_round'], 6)
+        self.assertEqual(state['participant_contributions'], {'Scientist': 3, 'Philosopher': 3})
+    
+    def test_cache_responses_reuses_arguments(self):
+        agent_ids = ['scientist', 'philosopher']
+        self.addCleanup(response_cache.clear)
+        response_cache.clear()
+        
+        first = RoundExecutorNode({'max_concurrent': 2, 'cache_responses': True})
+        first.agents = {agent_id: LoopBoundAgent(agent_id) for agent_id in agent_ids}
+        expected = first.execute(initial_state(agent_ids, max_rounds=2))['used_arguments']
+        
+        second = RoundExecutorNode({'max_concurrent': 2, 'cache_responses': True})
+        second.agents = {agent_id: LoopBoundAgent(agent_id) for agent_id in agent_ids}
+        update = second.execute(initial_state(agent_ids, max_rounds=2))
+        
+        self.assertEqual(update['used_arguments'], expected)
+        self.assertEqual([agent.calls for agent in second.agents.values()], [0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
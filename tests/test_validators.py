@@ -0,0 +1,56 @@
+import os
+import random
+import sys
+import unittest
+from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils import validators
+from utils.validators import ArgumentValidator
+
+
+class NoveltyTest(unittest.TestCase):
+    
+    def test_reinflected_near_duplicate_is_not_novel(self):
+        # Almost the same characters, but few words in common
+        used = ("Regulators regulate markets because studies showed harmful outcomes "
+                "and evidence suggested stronger rules would protect consumers")
+        argument = ("Regulator regulates market because study shows harmful outcome "
+                    "and evidences suggest strong rule would protects consumer")
+        self.assertFalse(ArgumentValidator().is_novel(argument, [used]))
+    
+    def test_different_argument_is_novel(self):
+        used = "Regulation protects consumers because evidence shows markets fail without rules"
+        argument = ("From an ethical standpoint, autonomy matters more than efficiency, "
+                    "therefore individuals should decide how their data is used")
+        self.assertTrue(ArgumentValidator().is_novel(argument, [used]))
+
+    
+    @unittest.skipUnless(validators.fuzz, "rapidfuzz not installed")
+    def test_rapidfuzz_prefilter_keeps_difflib_decisions(self):
+        # Fixed corpus of debate-like texts; decisions must match plain difflib
+        rnd = random.Random(7)
+        words = ("because therefore evidence research data analysis policy markets ethics "
+                 "society risk benefit harm trust regulation rights the a of").split()
+        corpus = []
+        for _ in range(100):
+            text = [rnd.choice(words) for _ in range(rnd.randint(8, 40))]
+            corpus.append(" ".join(text))
+            # A variant with a few words swapped, usually a near-duplicate
+            for _ in range(rnd.randint(1, 8)):
+                text[rnd.randrange(len(text))] = rnd.choice(words)
+            corpus.append(" ".join(text))
+        validator = ArgumentValidator()
+        for i, argument in enumerate(corpus[1:], 1):
+            used = corpus[max(0, i - 5):i]
+            expected = all(
+                SequenceMatcher(None, validator.normalize_text(argument), validator.normalize_text(other)).ratio()
+                <= validator.max_similarity
+                for other in used
+            )
+            self.assertEqual(validator.is_novel(argument, used), expected, argument)
+
+
+if __name__ == '__main__':
+    unittest.main()